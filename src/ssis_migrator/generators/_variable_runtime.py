@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Shared runtime support for SSIS variable handling
+
+Single home for the value coercion and validation logic that the
+VariableHandler uses while converting packages and that generated
+scripts import at runtime, so the rules live in exactly one place.
+"""
+
+import re
+from datetime import datetime
+from typing import Any
+
+# Truthy strings accepted for boolean variables, and the full set of
+# strings recognised as booleans at all
+TRUE_SET = frozenset(('true', '1', 'yes', 'on'))
+BOOL_SET = frozenset(('true', 'false', '1', '0', 'yes', 'no'))
+
+# Pattern for parameter substitution: $(ParameterName) or @[User::VariableName]
+PARAM_PATTERN = re.compile(r'\$\(([^)]+)\)|@\[User::([^\]]+)\]')
+
+
+def parse_iso(value: str) -> datetime:
+    # Only pay for the suffix rewrite when the string actually ends in 'Z'
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.lower() in TRUE_SET
+    return bool(value)
+
+
+def _to_datetime(value: Any) -> Any:
+    if isinstance(value, str):
+        return parse_iso(value)
+    return value
+
+
+def _check_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.lower() in BOOL_SET
+    return isinstance(value, bool)
+
+
+def _check_datetime(value: Any) -> bool:
+    if isinstance(value, str):
+        parse_iso(value)
+    return True
+
+
+def _check_int(value: Any) -> bool:
+    int(value)
+    return True
+
+
+def _check_float(value: Any) -> bool:
+    float(value)
+    return True
+
+
+# Dispatch tables keyed by the lowercase type names used both by
+# VariableType values and by generated configuration
+COERCERS = {
+    'int': int,
+    'float': float,
+    'boolean': _to_bool,
+    'datetime': _to_datetime,
+}
+
+CHECKERS = {
+    'int': _check_int,
+    'float': _check_float,
+    'boolean': _check_bool,
+    'datetime': _check_datetime,
+}
+
+
+def coerce_type(value: Any, expected_type: str) -> Any:
+    """Coerce value to the expected type, falling back to str"""
+    coercer = COERCERS.get(expected_type)
+    return coercer(value) if coercer else str(value)
+
+
+def check_type(value: Any, expected_type: str) -> bool:
+    """Check whether value is acceptable for the expected type"""
+    try:
+        checker = CHECKERS.get(expected_type)
+        return checker(value) if checker else True
+    except (ValueError, TypeError):
+        return False
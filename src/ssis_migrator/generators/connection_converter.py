@@ -8,7 +8,6 @@ from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from urllib.parse import urlparse, parse_qs
 from ..core.logger import LoggerMixin
 from ..core.error_handler import (
     ErrorHandler, ConversionError, create_error_context,
@@ -69,8 +68,8 @@ class PythonConnection:
     connection_type: str
     config: ConnectionConfig
     python_code: str
-    imports: List[str] = field(default_factory=list)
-    dependencies: List[str] = field(default_factory=list)
+    imports: Tuple[str, ...] = ()
+    dependencies: Tuple[str, ...] = ()
     error_handling: str = ""
 
 
@@ -205,7 +204,12 @@ class ConnectionConverter(LoggerMixin):
         """Convert a single connection manager to Python connection"""
         conn_name = conn_manager.get('name', 'Unknown')
         conn_type = conn_manager.get('connection_type', 'Unknown')
-        
+
+        # Fast path: OLE DB dominates real-world packages, so skip the
+        # substring scan in _get_connection_type for the exact spellings
+        if conn_type == 'OLEDB' or conn_type == 'OleDb':
+            return self._convert_oledb_connection(conn_manager)
+
         # Determine connection type
         connection_type = self._get_connection_type(conn_type)
         
@@ -259,18 +263,25 @@ class ConnectionConverter(LoggerMixin):
     def _parse_connection_string(self, connection_string: str) -> Dict[str, Any]:
         """Parse connection string into components"""
         params = {}
-        
-        try:
-            # Handle different connection string formats
-            if ';' in connection_string:
-                # OLE DB style connection string
-                pairs = connection_string.split(';')
-                for pair in pairs:
-                    if '=' in pair:
-                        key, value = pair.split('=', 1)
-                        params[key.strip().lower()] = value.strip()
-            elif '://' in connection_string:
-                # URL style connection string
+
+        # Skip parsing entirely for the file/HTTP/unknown paths that carry
+        # no connection string
+        if not connection_string:
+            return params
+
+        # Handle different connection string formats
+        if ';' in connection_string:
+            # OLE DB style connection string
+            pairs = connection_string.split(';')
+            for pair in pairs:
+                if '=' in pair:
+                    key, value = pair.split('=', 1)
+                    params[key.strip().lower()] = value.strip()
+        elif '://' in connection_string:
+            # URL style connection string. Imported here so cold imports of
+            # this module skip urllib.parse entirely.
+            from urllib.parse import urlparse, parse_qs
+            try:
                 parsed = urlparse(connection_string)
                 params['scheme'] = parsed.scheme
                 params['host'] = parsed.hostname
@@ -279,10 +290,9 @@ class ConnectionConverter(LoggerMixin):
                 params['username'] = parsed.username
                 params['password'] = parsed.password
                 params['query'] = parse_qs(parsed.query)
-            
-        except Exception as e:
-            self.logger.warning(f"Failed to parse connection string: {str(e)}")
-        
+            except ValueError as e:
+                self.logger.warning(f"Failed to parse connection string: {str(e)}")
+
         return params
     
     def _convert_oledb_connection(self, conn_manager: Dict[str, Any]) -> PythonConnection:
@@ -313,33 +323,27 @@ class ConnectionConverter(LoggerMixin):
         # Generate Python code based on provider
         if provider == DatabaseProvider.SQL_SERVER:
             python_code = self._generate_sql_server_connection(config)
-            imports = ["import pyodbc", "import sqlalchemy"]
-            dependencies = ["pyodbc", "sqlalchemy"]
+            imports = ("import pyodbc", "import sqlalchemy")
+            dependencies = ("pyodbc", "sqlalchemy")
         elif provider == DatabaseProvider.ORACLE:
             python_code = self._generate_oracle_connection(config)
-            imports = ["import cx_Oracle", "import sqlalchemy"]
-            dependencies = ["cx_Oracle", "sqlalchemy"]
+            imports = ("import cx_Oracle", "import sqlalchemy")
+            dependencies = ("cx_Oracle", "sqlalchemy")
         elif provider == DatabaseProvider.MYSQL:
             python_code = self._generate_mysql_connection(config)
-            imports = ["import pymysql", "import sqlalchemy"]
-            dependencies = ["pymysql", "sqlalchemy"]
+            imports = ("import pymysql", "import sqlalchemy")
+            dependencies = ("pymysql", "sqlalchemy")
         elif provider == DatabaseProvider.POSTGRESQL:
             python_code = self._generate_postgresql_connection(config)
-            imports = ["import psycopg2", "import sqlalchemy"]
-            dependencies = ["psycopg2-binary", "sqlalchemy"]
+            imports = ("import psycopg2", "import sqlalchemy")
+            dependencies = ("psycopg2-binary", "sqlalchemy")
         else:
             python_code = self._generate_generic_connection(config)
-            imports = ["import sqlalchemy"]
-            dependencies = ["sqlalchemy"]
+            imports = ("import sqlalchemy",)
+            dependencies = ("sqlalchemy",)
         
-        return PythonConnection(
-            name=conn_name,
-            connection_type="database",
-            config=config,
-            python_code=python_code,
-            imports=imports,
-            dependencies=dependencies
-        )
+        return PythonConnection(conn_name, "database", config, python_code,
+                                imports, dependencies)
     
     def _convert_flat_file_connection(self, conn_manager: Dict[str, Any]) -> PythonConnection:
         """Convert Flat File connection to Python"""
@@ -355,14 +359,8 @@ class ConnectionConverter(LoggerMixin):
         
         python_code = self._generate_flat_file_connection(config)
         
-        return PythonConnection(
-            name=conn_name,
-            connection_type="file",
-            config=config,
-            python_code=python_code,
-            imports=["import pandas as pd"],
-            dependencies=["pandas"]
-        )
+        return PythonConnection(conn_name, "file", config, python_code,
+                                ("import pandas as pd",), ("pandas",))
     
     def _convert_excel_connection(self, conn_manager: Dict[str, Any]) -> PythonConnection:
         """Convert Excel connection to Python"""
@@ -378,14 +376,9 @@ class ConnectionConverter(LoggerMixin):
         
         python_code = self._generate_excel_connection(config)
         
-        return PythonConnection(
-            name=conn_name,
-            connection_type="file",
-            config=config,
-            python_code=python_code,
-            imports=["import pandas as pd", "import openpyxl"],
-            dependencies=["pandas", "openpyxl"]
-        )
+        return PythonConnection(conn_name, "file", config, python_code,
+                                ("import pandas as pd", "import openpyxl"),
+                                ("pandas", "openpyxl"))
     
     def _convert_http_connection(self, conn_manager: Dict[str, Any]) -> PythonConnection:
         """Convert HTTP connection to Python"""
@@ -401,14 +394,8 @@ class ConnectionConverter(LoggerMixin):
         
         python_code = self._generate_http_connection(config)
         
-        return PythonConnection(
-            name=conn_name,
-            connection_type="web",
-            config=config,
-            python_code=python_code,
-            imports=["import requests"],
-            dependencies=["requests"]
-        )
+        return PythonConnection(conn_name, "web", config, python_code,
+                                ("import requests",), ("requests",))
     
     def _convert_unknown_connection(self, conn_manager: Dict[str, Any]) -> PythonConnection:
         """Convert unknown connection type to Python"""
@@ -428,14 +415,7 @@ def get_{conn_name.lower().replace(' ', '_')}_connection():
     raise NotImplementedError("Connection type not yet supported")
 """
         
-        return PythonConnection(
-            name=conn_name,
-            connection_type="unknown",
-            config=config,
-            python_code=python_code,
-            imports=[],
-            dependencies=[]
-        )
+        return PythonConnection(conn_name, "unknown", config, python_code)
     
     def _convert_ado_net_connection(self, conn_manager: Dict[str, Any]) -> PythonConnection:
         """Convert ADO.NET connection to Python"""
@@ -465,33 +445,27 @@ def get_{conn_name.lower().replace(' ', '_')}_connection():
         # Generate Python code based on provider
         if provider == DatabaseProvider.SQL_SERVER:
             python_code = self._generate_sql_server_connection(config)
-            imports = ["import pyodbc", "import sqlalchemy"]
-            dependencies = ["pyodbc", "sqlalchemy"]
+            imports = ("import pyodbc", "import sqlalchemy")
+            dependencies = ("pyodbc", "sqlalchemy")
         elif provider == DatabaseProvider.ORACLE:
             python_code = self._generate_oracle_connection(config)
-            imports = ["import cx_Oracle", "import sqlalchemy"]
-            dependencies = ["cx_Oracle", "sqlalchemy"]
+            imports = ("import cx_Oracle", "import sqlalchemy")
+            dependencies = ("cx_Oracle", "sqlalchemy")
         elif provider == DatabaseProvider.MYSQL:
             python_code = self._generate_mysql_connection(config)
-            imports = ["import pymysql", "import sqlalchemy"]
-            dependencies = ["pymysql", "sqlalchemy"]
+            imports = ("import pymysql", "import sqlalchemy")
+            dependencies = ("pymysql", "sqlalchemy")
         elif provider == DatabaseProvider.POSTGRESQL:
             python_code = self._generate_postgresql_connection(config)
-            imports = ["import psycopg2", "import sqlalchemy"]
-            dependencies = ["psycopg2-binary", "sqlalchemy"]
+            imports = ("import psycopg2", "import sqlalchemy")
+            dependencies = ("psycopg2-binary", "sqlalchemy")
         else:
             python_code = self._generate_generic_connection(config)
-            imports = ["import sqlalchemy"]
-            dependencies = ["sqlalchemy"]
+            imports = ("import sqlalchemy",)
+            dependencies = ("sqlalchemy",)
         
-        return PythonConnection(
-            name=conn_name,
-            connection_type="database",
-            config=config,
-            python_code=python_code,
-            imports=imports,
-            dependencies=dependencies
-        )
+        return PythonConnection(conn_name, "database", config, python_code,
+                                imports, dependencies)
     
     def _convert_xml_connection(self, conn_manager: Dict[str, Any]) -> PythonConnection:
         """Convert XML connection to Python"""
@@ -527,14 +501,8 @@ def get_{conn_name.lower().replace(' ', '_')}_connection():
         raise Exception(f"Failed to read XML file: {{str(e)}}")
 """
         
-        return PythonConnection(
-            name=conn_name,
-            connection_type="file",
-            config=config,
-            python_code=python_code,
-            imports=["import xml.etree.ElementTree as ET"],
-            dependencies=[]
-        )
+        return PythonConnection(conn_name, "file", config, python_code,
+                                ("import xml.etree.ElementTree as ET",))
     
     def _convert_ftp_connection(self, conn_manager: Dict[str, Any]) -> PythonConnection:
         """Convert FTP connection to Python"""
@@ -562,14 +530,8 @@ def get_{conn_name.lower().replace(' ', '_')}_connection():
         raise Exception(f"Failed to connect to FTP: {{str(e)}}")
 """
         
-        return PythonConnection(
-            name=conn_name,
-            connection_type="web",
-            config=config,
-            python_code=python_code,
-            imports=["from ftplib import FTP"],
-            dependencies=[]
-        )
+        return PythonConnection(conn_name, "web", config, python_code,
+                                ("from ftplib import FTP",))
     
     def _convert_smtp_connection(self, conn_manager: Dict[str, Any]) -> PythonConnection:
         """Convert SMTP connection to Python"""
@@ -597,14 +559,8 @@ def get_{conn_name.lower().replace(' ', '_')}_connection():
         raise Exception(f"Failed to connect to SMTP: {{str(e)}}")
 """
         
-        return PythonConnection(
-            name=conn_name,
-            connection_type="web",
-            config=config,
-            python_code=python_code,
-            imports=["import smtplib"],
-            dependencies=[]
-        )
+        return PythonConnection(conn_name, "web", config, python_code,
+                                ("import smtplib",))
     
     def _convert_file_connection(self, conn_manager: Dict[str, Any]) -> PythonConnection:
         """Convert FILE connection to Python"""
@@ -635,14 +591,7 @@ def get_{conn_name.lower().replace(' ', '_')}_connection():
         raise Exception(f"Failed to access file: {{str(e)}}")
 """
         
-        return PythonConnection(
-            name=conn_name,
-            connection_type="file",
-            config=config,
-            python_code=python_code,
-            imports=[],
-            dependencies=[]
-        )
+        return PythonConnection(conn_name, "file", config, python_code)
     
     def _generate_sql_server_connection(self, config: ConnectionConfig) -> str:
         """Generate SQL Server connection code"""
@@ -3,6 +3,9 @@
 Data Flow Mapper - Convert SSIS data flow components to Python/Pandas operations
 """
 
+import io
+import re
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
@@ -59,7 +62,7 @@ class ConnectionType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class ColumnMapping:
     """Column mapping information"""
     source_column: str
@@ -71,7 +74,7 @@ class ColumnMapping:
     default_value: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TransformationRule:
     """Transformation rule for data flow components"""
     component_type: ComponentType
@@ -82,7 +85,7 @@ class TransformationRule:
     validation: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DataFlowMapping:
     """Complete data flow mapping result"""
     source_code: str
@@ -95,118 +98,106 @@ class DataFlowMapping:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-class DataFlowMapper(LoggerMixin):
-    """Maps SSIS data flow components to Python/Pandas operations"""
-    
-    def __init__(self, error_handler: Optional[ErrorHandler] = None):
-        self.error_handler = error_handler or ErrorHandler()
-        self.logger.info("Data Flow Mapper initialized")
-        
-        # Initialize transformation rules
-        self.transformation_rules = self._initialize_transformation_rules()
-        
-        # Connection type mappings
-        self.connection_mappings = {
-            'OLEDB': ConnectionType.SQL_SERVER,
-            'SQLNCLI': ConnectionType.SQL_SERVER,
-            'SQLNCLI11': ConnectionType.SQL_SERVER,
-            'MSOLEDBSQL': ConnectionType.SQL_SERVER,
-            'Oracle': ConnectionType.ORACLE,
-            'MySQL': ConnectionType.MYSQL,
-            'PostgreSQL': ConnectionType.POSTGRESQL,
-            'SQLite': ConnectionType.SQLITE,
-            'Excel': ConnectionType.EXCEL,
-            'FlatFile': ConnectionType.FLAT_FILE,
-            'XML': ConnectionType.XML,
-            'JSON': ConnectionType.JSON
-        }
-    
-    def map_data_flow(self, components: List[Dict[str, Any]]) -> DataFlowMapping:
-        """
-        Map SSIS data flow components to Python code
-        
-        Args:
-            components: List of SSIS data flow components
-            
-        Returns:
-            DataFlowMapping with generated Python code
-        """
-        try:
-            self.logger.info(f"Mapping {len(components)} data flow components")
-            
-            # Separate components by type
-            sources = [c for c in components if self._is_source_component(c)]
-            destinations = [c for c in components if self._is_destination_component(c)]
-            transformations = [c for c in components if self._is_transformation_component(c)]
-            
-            # Generate source code
-            source_code = self._generate_source_code(sources)
-            
-            # Generate transformation code
-            transformation_code = self._generate_transformation_code(transformations)
-            
-            # Generate destination code
-            destination_code = self._generate_destination_code(destinations)
-            
-            # Collect all imports and dependencies
-            all_imports = self._collect_imports(sources, transformations, destinations)
-            all_dependencies = self._collect_dependencies(sources, transformations, destinations)
-            
-            # Generate error handling
-            error_handling = self._generate_error_handling()
-            
-            # Generate validation code
-            validation_code = self._generate_validation_code(components)
-            
-            mapping = DataFlowMapping(
-                source_code=source_code,
-                transformation_code=transformation_code,
-                destination_code=destination_code,
-                imports=all_imports,
-                dependencies=all_dependencies,
-                error_handling=error_handling,
-                validation_code=validation_code,
-                metadata={
-                    'component_count': len(components),
-                    'source_count': len(sources),
-                    'transformation_count': len(transformations),
-                    'destination_count': len(destinations)
-                }
-            )
-            
-            self.logger.info("Data flow mapping completed successfully")
-            return mapping
-            
-        except Exception as e:
-            error = ConversionError(
-                f"Failed to map data flow: {str(e)}",
-                severity=ErrorSeverity.HIGH,
-                source_component="DataFlowMapper"
-            )
-            self.error_handler.handle_error(
-                error,
-                context=create_error_context(
-                    component="DataFlowMapper",
-                    operation="map_data_flow"
-                )
-            )
-            raise
-    
-    def _initialize_transformation_rules(self) -> Dict[ComponentType, TransformationRule]:
-        """Initialize transformation rules for different component types"""
-        rules = {}
-        
-        # Source components
-        rules[ComponentType.SOURCE] = TransformationRule(
-            component_type=ComponentType.SOURCE,
-            python_code="""
+@lru_cache(maxsize=4096)
+def _slugify(name: str) -> str:
+    """Turn a component name into a Python identifier, cached across calls"""
+    return name.lower().replace(' ', '_')
+
+# Classification keywords compiled into single regexes so each component is
+# classified with one C-level scan instead of repeated substring checks;
+# multi-word alternatives come first so they win over their substrings
+_SRC_RE = re.compile(r'source|adapter|reader')
+_DST_RE = re.compile(r'destination|writer')
+_TYPE_RE = re.compile(
+    r'(?P<DERIVED_COLUMN>derived column)'
+    r'|(?P<CONDITIONAL_SPLIT>conditional split)'
+    r'|(?P<DATA_CONVERSION>data conversion)'
+    r'|(?P<LOOKUP>lookup)'
+    r'|(?P<SORT>sort)'
+    r'|(?P<AGGREGATE>aggregate)'
+)
+
+
+# Per-component emission templates; one format_map call replaces several
+# f-string writes per component
+_SRC_TMPL_QUERY = '''# {name}
+def read_{slug}():
+    """Read data from {name}"""
+    connection_string = '{cs}'
+    query = \'\'\'{query}\'\'\'
+    return read_source_data(connection_string, query=query)
+
+'''
+
+_SRC_TMPL_TABLE = '''# {name}
+def read_{slug}():
+    """Read data from {name}"""
+    connection_string = '{cs}'
+    table_name = '{table}'
+    return read_source_data(connection_string, table_name=table_name)
+
+'''
+
+_SRC_TMPL_EMPTY = '''# {name}
+def read_{slug}():
+    """Read data from {name}"""
+    connection_string = '{cs}'
+    # No query or table specified
+    return None
+
+'''
+
+_DST_TMPL = '''# {name}
+def write_{slug}(df):
+    """Write data to {name}"""
+    connection_string = '{cs}'
+    table_name = '{table}'
+    return write_destination_data(df, connection_string, table_name, if_exists='{if_exists}',
+                                  chunksize={chunksize}, method='{method}')
+
+'''
+
+_DST_TMPL_DUCKDB = '''# {name}
+def write_{slug}(df):
+    """Write data to {name}"""
+    path = '{path}'
+    table_name = '{table}'
+    return write_destination_data_duckdb(df, path, table_name)
+
+'''
+
+# Pooled-engine helper, emitted only for flows that talk to a database
+_ENGINE_HELPER_CODE = '''
+from functools import lru_cache
+
+from sqlalchemy import create_engine
+
+
+@lru_cache(maxsize=None)
+def _get_engine(connection_string):
+    """Create one pooled engine per connection string"""
+    if connection_string.startswith('mssql+pyodbc'):
+        # fast_executemany is a pyodbc-only flag; other mssql drivers
+        # (pymssql, aioodbc) raise TypeError when it is passed through
+        return create_engine(connection_string, pool_pre_ping=True,
+                             fast_executemany=True)
+    return create_engine(connection_string, pool_pre_ping=True)
+
+'''
+
+
+def _build_transformation_rules() -> Dict[ComponentType, TransformationRule]:
+    """Build the transformation rules shared by every mapper instance"""
+    rules = {}
+
+    # Source components
+    rules[ComponentType.SOURCE] = TransformationRule(
+        component_type=ComponentType.SOURCE,
+        python_code="""
 def read_source_data(connection_string, query=None, table_name=None):
     \"\"\"Read data from source\"\"\"
-    import pandas as pd
-    from sqlalchemy import create_engine
-    
     try:
-        engine = create_engine(connection_string)
+        engine = _get_engine(connection_string)
         if query:
             df = pd.read_sql(query, engine)
         elif table_name:
@@ -218,290 +209,584 @@ def read_source_data(connection_string, query=None, table_name=None):
     except Exception as e:
         raise Exception(f"Error reading source data: {str(e)}")
 """,
-            imports=["pandas as pd", "sqlalchemy"],
-            dependencies=["pandas", "sqlalchemy"]
-        )
-        
-        # Destination components
-        rules[ComponentType.DESTINATION] = TransformationRule(
-            component_type=ComponentType.DESTINATION,
-            python_code="""
-def write_destination_data(df, connection_string, table_name, if_exists='replace'):
-    \"\"\"Write data to destination\"\"\"
-    import pandas as pd
-    from sqlalchemy import create_engine
-    
+        imports=["pandas as pd", "sqlalchemy"],
+        dependencies=["pandas", "sqlalchemy"]
+    )
+    
+    # Destination components
+    rules[ComponentType.DESTINATION] = TransformationRule(
+        component_type=ComponentType.DESTINATION,
+        python_code="""
+def write_destination_data(df, connection_string, table_name, if_exists='replace',
+                           chunksize=10000, method='multi'):
+    \"\"\"Write data to destination using the fastest path for the dialect\"\"\"
+    from io import StringIO
+
     try:
-        engine = create_engine(connection_string)
-        df.to_sql(table_name, engine, if_exists=if_exists, index=False)
+        engine = _get_engine(connection_string)
+        dialect = engine.dialect.name
+
+        if dialect == 'postgresql':
+            # COPY FROM STDIN avoids per-row INSERT round trips entirely
+            df.head(0).to_sql(table_name, engine, if_exists=if_exists, index=False)
+            raw_conn = engine.raw_connection()
+            try:
+                with raw_conn.cursor() as cursor:
+                    buffer = StringIO(df.to_csv(index=False, header=False))
+                    columns = ', '.join(f'"{col}"' for col in df.columns)
+                    cursor.copy_expert(
+                        f'COPY {table_name} ({columns}) FROM STDIN WITH CSV',
+                        buffer
+                    )
+                raw_conn.commit()
+            finally:
+                raw_conn.close()
+        elif dialect == 'mysql':
+            # Multi-row INSERT statements batch many rows per round trip
+            df.to_sql(table_name, engine, if_exists=if_exists, index=False,
+                      method=method, chunksize=chunksize)
+        elif dialect == 'mssql':
+            # SQL Server caps a statement at 2100 bound parameters, so
+            # method='multi' breaks on wide tables; plain executemany
+            # (method=None) lets pyodbc's fast_executemany batch at the
+            # driver level instead
+            df.to_sql(table_name, engine, if_exists=if_exists, index=False,
+                      method=None, chunksize=chunksize)
+        else:
+            df.to_sql(table_name, engine, if_exists=if_exists, index=False,
+                      chunksize=chunksize)
         return True
     except Exception as e:
         raise Exception(f"Error writing destination data: {str(e)}")
+
+
+def write_destination_data_duckdb(df, path, table_name):
+    \"\"\"Write data via DuckDB's vectorized ingestion of the DataFrame\"\"\"
+    import duckdb
+
+    try:
+        con = duckdb.connect(path)
+        try:
+            con.register('df_view', df)
+            con.execute(f"CREATE OR REPLACE TABLE {table_name} AS SELECT * FROM df_view")
+        finally:
+            con.close()
+        return True
+    except Exception as e:
+        raise Exception(f"Error writing destination data via DuckDB: {str(e)}")
 """,
-            imports=["pandas as pd", "sqlalchemy"],
-            dependencies=["pandas", "sqlalchemy"]
-        )
-        
-        # Derived Column transformation
-        rules[ComponentType.DERIVED_COLUMN] = TransformationRule(
-            component_type=ComponentType.DERIVED_COLUMN,
-            python_code="""
+        imports=["pandas as pd", "sqlalchemy"],
+        dependencies=["pandas", "sqlalchemy"]
+    )
+    
+    # Derived Column transformation
+    rules[ComponentType.DERIVED_COLUMN] = TransformationRule(
+        component_type=ComponentType.DERIVED_COLUMN,
+        python_code="""
 def apply_derived_columns(df, column_expressions):
     \"\"\"Apply derived column expressions\"\"\"
-    import pandas as pd
-    
     try:
-        for col_name, expression in column_expressions.items():
-            df[col_name] = df.eval(expression)
+        # One multi-assignment eval compiles once and vectorizes all
+        # expressions through numexpr instead of one eval per column
+        multi_expr = "\\n".join(
+            f"{col_name} = {expression}"
+            for col_name, expression in column_expressions.items()
+        )
+        df.eval(multi_expr, engine='numexpr', inplace=True)
         return df
     except Exception as e:
         raise Exception(f"Error applying derived columns: {str(e)}")
 """,
-            imports=["pandas as pd"],
-            dependencies=["pandas"]
-        )
-        
-        # Lookup transformation
-        rules[ComponentType.LOOKUP] = TransformationRule(
-            component_type=ComponentType.LOOKUP,
-            python_code="""
+        imports=["pandas as pd"],
+        dependencies=["pandas", "numexpr"]
+    )
+    
+    # Lookup transformation
+    rules[ComponentType.LOOKUP] = TransformationRule(
+        component_type=ComponentType.LOOKUP,
+        python_code="""
 def perform_lookup(df, lookup_df, left_on, right_on, how='left'):
     \"\"\"Perform lookup operation\"\"\"
-    import pandas as pd
-    
     try:
         result = df.merge(lookup_df, left_on=left_on, right_on=right_on, how=how)
         return result
     except Exception as e:
         raise Exception(f"Error performing lookup: {str(e)}")
 """,
-            imports=["pandas as pd"],
-            dependencies=["pandas"]
-        )
-        
-        # Sort transformation
-        rules[ComponentType.SORT] = TransformationRule(
-            component_type=ComponentType.SORT,
-            python_code="""
+        imports=["pandas as pd"],
+        dependencies=["pandas"]
+    )
+    
+    # Sort transformation
+    rules[ComponentType.SORT] = TransformationRule(
+        component_type=ComponentType.SORT,
+        python_code="""
 def sort_data(df, sort_columns, ascending=True):
     \"\"\"Sort data by specified columns\"\"\"
-    import pandas as pd
-    
     try:
         return df.sort_values(by=sort_columns, ascending=ascending)
     except Exception as e:
         raise Exception(f"Error sorting data: {str(e)}")
 """,
-            imports=["pandas as pd"],
-            dependencies=["pandas"]
-        )
-        
-        # Aggregate transformation
-        rules[ComponentType.AGGREGATE] = TransformationRule(
-            component_type=ComponentType.AGGREGATE,
-            python_code="""
+        imports=["pandas as pd"],
+        dependencies=["pandas"]
+    )
+    
+    # Aggregate transformation
+    rules[ComponentType.AGGREGATE] = TransformationRule(
+        component_type=ComponentType.AGGREGATE,
+        python_code="""
 def aggregate_data(df, group_columns, agg_functions):
     \"\"\"Aggregate data by specified columns\"\"\"
-    import pandas as pd
-    
     try:
+        # Numba fast path: single group key and plain numeric reducers can
+        # run as offset-based kernels over sorted keys, skipping the
+        # per-group Python dispatch of groupby().agg()
+        if (
+            len(group_columns) == 1
+            and all(f in ('sum', 'mean', 'max', 'min', 'count')
+                    for f in agg_functions.values())
+        ):
+            try:
+                return _aggregate_data_numba(df, group_columns[0], agg_functions)
+            except Exception:
+                # Numba missing or unable to compile for these dtypes;
+                # the groupby path always works
+                pass
         return df.groupby(group_columns).agg(agg_functions).reset_index()
     except Exception as e:
         raise Exception(f"Error aggregating data: {str(e)}")
+
+
+def _aggregate_data_numba(df, group_column, agg_functions):
+    \"\"\"Offset-based aggregation over sorted group keys via Numba kernels
+
+    All kernels skip NaN and report per-group non-NaN counts so the
+    results match pandas' groupby semantics (sum/mean/max/min skip NaN,
+    count counts non-NaN values).
+    \"\"\"
+    import numpy as np
+    import pandas as pd
+    from numba import njit, prange
+
+    @njit(parallel=True, cache=True)
+    def _nansum_by_offsets(values, offsets, out, cnt):
+        for g in prange(len(offsets) - 1):
+            total = 0.0
+            n = 0
+            for i in range(offsets[g], offsets[g + 1]):
+                v = values[i]
+                if not np.isnan(v):
+                    total += v
+                    n += 1
+            out[g] = total
+            cnt[g] = n
+
+    @njit(parallel=True, cache=True)
+    def _nanmax_by_offsets(values, offsets, out):
+        for g in prange(len(offsets) - 1):
+            best = np.nan
+            for i in range(offsets[g], offsets[g + 1]):
+                v = values[i]
+                if not np.isnan(v) and (np.isnan(best) or v > best):
+                    best = v
+            out[g] = best
+
+    @njit(parallel=True, cache=True)
+    def _nanmin_by_offsets(values, offsets, out):
+        for g in prange(len(offsets) - 1):
+            best = np.nan
+            for i in range(offsets[g], offsets[g + 1]):
+                v = values[i]
+                if not np.isnan(v) and (np.isnan(best) or v < best):
+                    best = v
+            out[g] = best
+
+    sorted_df = df.sort_values(group_column, kind='mergesort')
+    codes, uniques = pd.factorize(sorted_df[group_column], sort=True)
+    offsets = np.concatenate(([0], np.flatnonzero(np.diff(codes)) + 1, [len(codes)]))
+    n_groups = len(offsets) - 1
+
+    result = {group_column: uniques}
+    for column, func in agg_functions.items():
+        values = sorted_df[column].to_numpy(dtype=np.float64)
+        out = np.empty(n_groups, dtype=np.float64)
+        cnt = np.empty(n_groups, dtype=np.int64)
+        if func in ('sum', 'mean', 'count'):
+            _nansum_by_offsets(values, offsets, out, cnt)
+            if func == 'count':
+                out = cnt
+            elif func == 'mean':
+                # where= keeps all-NaN groups at NaN without tripping a
+                # divide-by-zero warning
+                out = np.divide(out, cnt, out=np.full(n_groups, np.nan),
+                                where=cnt > 0)
+        elif func == 'max':
+            _nanmax_by_offsets(values, offsets, out)
+        else:
+            _nanmin_by_offsets(values, offsets, out)
+        result[column] = out
+
+    return pd.DataFrame(result)
 """,
-            imports=["pandas as pd"],
-            dependencies=["pandas"]
-        )
-        
-        # Conditional Split transformation
-        rules[ComponentType.CONDITIONAL_SPLIT] = TransformationRule(
-            component_type=ComponentType.CONDITIONAL_SPLIT,
-            python_code="""
+        imports=["pandas as pd"],
+        dependencies=["pandas"]
+    )
+    
+    # Conditional Split transformation
+    rules[ComponentType.CONDITIONAL_SPLIT] = TransformationRule(
+        component_type=ComponentType.CONDITIONAL_SPLIT,
+        python_code="""
 def conditional_split(df, conditions):
     \"\"\"Split data based on conditions\"\"\"
-    import pandas as pd
-    
     try:
         results = {}
         for condition_name, condition_expr in conditions.items():
-            mask = df.eval(condition_expr)
+            mask = df.eval(condition_expr, engine='numexpr')
             results[condition_name] = df[mask].copy()
         return results
     except Exception as e:
         raise Exception(f"Error in conditional split: {str(e)}")
 """,
-            imports=["pandas as pd"],
-            dependencies=["pandas"]
-        )
-        
-        # Data Conversion transformation
-        rules[ComponentType.DATA_CONVERSION] = TransformationRule(
-            component_type=ComponentType.DATA_CONVERSION,
-            python_code="""
+        imports=["pandas as pd"],
+        dependencies=["pandas", "numexpr"]
+    )
+    
+    # Data Conversion transformation
+    rules[ComponentType.DATA_CONVERSION] = TransformationRule(
+        component_type=ComponentType.DATA_CONVERSION,
+        python_code="""
+_TRUE_STRINGS = frozenset(('true', '1', 'yes', 'on'))
+_FALSE_STRINGS = frozenset(('false', '0', 'no', 'off'))
+
+
+def _coerce_bool(value):
+    \"\"\"Coerce one cell to bool, NA when unrecognised\"\"\"
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _TRUE_STRINGS:
+            return True
+        if lowered in _FALSE_STRINGS:
+            return False
+        return pd.NA
+    if pd.isna(value):
+        return pd.NA
+    return bool(value)
+
+
 def convert_data_types(df, type_mappings):
     \"\"\"Convert data types of columns\"\"\"
-    import pandas as pd
-    
     try:
+        # Every cast coerces per value: a stray bad cell becomes NA
+        # instead of silently leaving the whole column unconverted
+        # (astype is all-or-nothing per column) or raising out of the
+        # run (astype('boolean') rejects string columns outright)
+        string_casts = []
         for column, target_type in type_mappings.items():
             if target_type == 'int':
                 df[column] = pd.to_numeric(df[column], errors='coerce').astype('Int64')
             elif target_type == 'float':
                 df[column] = pd.to_numeric(df[column], errors='coerce')
             elif target_type == 'datetime':
-                df[column] = pd.to_datetime(df[column], errors='coerce')
-            elif target_type == 'string':
-                df[column] = df[column].astype(str)
+                df[column] = pd.to_datetime(df[column], errors='coerce', cache=True)
             elif target_type == 'bool':
-                df[column] = df[column].astype(bool)
+                df[column] = df[column].map(_coerce_bool).astype('boolean')
+            elif target_type == 'string':
+                string_casts.append(column)
+        if string_casts:
+            # str() never fails, so the string columns share one
+            # vectorized astype pass
+            df = df.astype({column: 'string[pyarrow]' for column in string_casts})
         return df
     except Exception as e:
         raise Exception(f"Error converting data types: {str(e)}")
 """,
-            imports=["pandas as pd"],
-            dependencies=["pandas"]
-        )
+        imports=["pandas as pd"],
+        dependencies=["pandas", "pyarrow"]
+    )
+    
+
+    return rules
+
+
+# Rules and connection mappings carry no per-instance state, so they are
+# built once at import time rather than per DataFlowMapper
+_TRANSFORMATION_RULES = _build_transformation_rules()
+
+_CONNECTION_MAPPINGS = {
+    'OLEDB': ConnectionType.SQL_SERVER,
+    'SQLNCLI': ConnectionType.SQL_SERVER,
+    'SQLNCLI11': ConnectionType.SQL_SERVER,
+    'MSOLEDBSQL': ConnectionType.SQL_SERVER,
+    'Oracle': ConnectionType.ORACLE,
+    'MySQL': ConnectionType.MYSQL,
+    'PostgreSQL': ConnectionType.POSTGRESQL,
+    'SQLite': ConnectionType.SQLITE,
+    'Excel': ConnectionType.EXCEL,
+    'FlatFile': ConnectionType.FLAT_FILE,
+    'XML': ConnectionType.XML,
+    'JSON': ConnectionType.JSON
+}
+
+
+class DataFlowMapper(LoggerMixin):
+    """Maps SSIS data flow components to Python/Pandas operations"""
+    
+    def __init__(self, error_handler: Optional[ErrorHandler] = None):
+        self.error_handler = error_handler or ErrorHandler()
+        self.logger.info("Data Flow Mapper initialized")
         
-        return rules
+        # Rules and connection mappings are module-level constants shared
+        # across instances
+        self.transformation_rules = _TRANSFORMATION_RULES
+        self.connection_mappings = _CONNECTION_MAPPINGS
+    
+    def map_data_flow(self, components: List[Dict[str, Any]]) -> DataFlowMapping:
+        """
+        Map SSIS data flow components to Python code
+        
+        Args:
+            components: List of SSIS data flow components
+            
+        Returns:
+            DataFlowMapping with generated Python code
+        """
+        try:
+            self.logger.info(f"Mapping {len(components)} data flow components")
+            
+            # Separate components by type in a single pass, lowercasing each
+            # component type once
+            sources = []
+            destinations = []
+            transformations = []
+            for c in components:
+                ct = c.get('component_type', '').lower()
+                if _SRC_RE.search(ct):
+                    sources.append(c)
+                elif _DST_RE.search(ct):
+                    destinations.append(c)
+                else:
+                    transformations.append(c)
+            
+            # Generate source code
+            source_code = self._generate_source_code(sources)
+            
+            # Generate transformation code
+            transformation_code = self._generate_transformation_code(transformations)
+            
+            # Generate destination code
+            destination_code = self._generate_destination_code(destinations)
+            
+            # One predicate decides both the sqlalchemy import and the
+            # emission of the engine helper, so generated code can never
+            # import a dependency it lacks or call a helper that was
+            # not emitted
+            needs_engine = (
+                any(self._is_database_connection(c) for c in sources)
+                or any(self._is_database_connection(c) for c in destinations)
+            )
+
+            # Collect all imports and dependencies in a single pass
+            all_imports, all_dependencies = self._collect_imports_and_deps(
+                sources, transformations, destinations, needs_engine
+            )
+
+            # Generate error handling
+            error_handling = self._generate_error_handling(needs_engine)
+            
+            # Generate validation code
+            validation_code = self._generate_validation_code(components)
+            
+            mapping = DataFlowMapping(
+                source_code=source_code,
+                transformation_code=transformation_code,
+                destination_code=destination_code,
+                imports=all_imports,
+                dependencies=all_dependencies,
+                error_handling=error_handling,
+                validation_code=validation_code,
+                metadata={
+                    'component_count': len(components),
+                    'source_count': len(sources),
+                    'transformation_count': len(transformations),
+                    'destination_count': len(destinations)
+                }
+            )
+            
+            self.logger.info("Data flow mapping completed successfully")
+            return mapping
+            
+        except Exception as e:
+            error = ConversionError(
+                f"Failed to map data flow: {str(e)}",
+                severity=ErrorSeverity.HIGH,
+                source_component="DataFlowMapper"
+            )
+            self.error_handler.handle_error(
+                error,
+                context=create_error_context(
+                    component="DataFlowMapper",
+                    operation="map_data_flow"
+                )
+            )
+            raise
     
     def _is_source_component(self, component: Dict[str, Any]) -> bool:
         """Check if component is a source component"""
-        component_type = component.get('component_type', '').lower()
-        return any(source_type in component_type for source_type in [
-            'source', 'ole db source', 'excel source', 'flat file source',
-            'xml source', 'adapter', 'reader'
-        ])
-    
+        return _SRC_RE.search(component.get('component_type', '').lower()) is not None
+
     def _is_destination_component(self, component: Dict[str, Any]) -> bool:
         """Check if component is a destination component"""
-        component_type = component.get('component_type', '').lower()
-        return any(dest_type in component_type for dest_type in [
-            'destination', 'ole db destination', 'excel destination', 
-            'flat file destination', 'xml destination', 'writer'
-        ])
+        return _DST_RE.search(component.get('component_type', '').lower()) is not None
     
     def _is_transformation_component(self, component: Dict[str, Any]) -> bool:
         """Check if component is a transformation component"""
         return not (self._is_source_component(component) or self._is_destination_component(component))
     
+    def _is_database_connection(self, component: Dict[str, Any]) -> bool:
+        """Check if a component reads from or writes to a database"""
+        connection_type = self.connection_mappings.get(
+            component.get('connection_type', ''), ConnectionType.UNKNOWN
+        )
+        return connection_type in (
+            ConnectionType.SQL_SERVER, ConnectionType.ORACLE,
+            ConnectionType.MYSQL, ConnectionType.POSTGRESQL,
+            ConnectionType.SQLITE
+        )
+
+    def _is_duckdb_eligible(self, destination: Dict[str, Any]) -> bool:
+        """Check if a destination can be loaded through DuckDB"""
+        connection_type = self.connection_mappings.get(
+            destination.get('connection_type', ''), ConnectionType.UNKNOWN
+        )
+        return connection_type in (
+            ConnectionType.CSV, ConnectionType.FLAT_FILE,
+            ConnectionType.EXCEL, ConnectionType.SQLITE
+        )
+
     def _generate_source_code(self, sources: List[Dict[str, Any]]) -> str:
         """Generate Python code for source components"""
         if not sources:
             return "# No source components found"
-        
-        code_lines = ["# Source Components", ""]
-        
+
+        buf = io.StringIO()
+        buf.write("# Source Components\n\n")
+
         for i, source in enumerate(sources):
             component_name = source.get('name', f'source_{i}')
             connection_string = source.get('connection_string', '')
             query = source.get('query', '')
             table_name = source.get('table_name', '')
-            
-            code_lines.extend([
-                f"# {component_name}",
-                f"def read_{component_name.lower().replace(' ', '_')}():",
-                f"    \"\"\"Read data from {component_name}\"\"\"",
-                f"    connection_string = '{connection_string}'"
-            ])
-            
+
             if query:
-                code_lines.append(f"    query = '''{query}'''")
-                code_lines.append("    return read_source_data(connection_string, query=query)")
+                tmpl = _SRC_TMPL_QUERY
             elif table_name:
-                code_lines.append(f"    table_name = '{table_name}'")
-                code_lines.append("    return read_source_data(connection_string, table_name=table_name)")
+                tmpl = _SRC_TMPL_TABLE
             else:
-                code_lines.append("    # No query or table specified")
-                code_lines.append("    return None")
-            
-            code_lines.append("")
-        
-        return "\n".join(code_lines)
+                tmpl = _SRC_TMPL_EMPTY
+
+            buf.write(tmpl.format_map({
+                'name': component_name,
+                'slug': _slugify(component_name),
+                'cs': connection_string,
+                'query': query,
+                'table': table_name
+            }))
+
+        return buf.getvalue()[:-1]
     
     def _generate_transformation_code(self, transformations: List[Dict[str, Any]]) -> str:
         """Generate Python code for transformation components"""
         if not transformations:
             return "# No transformation components found"
-        
-        code_lines = ["# Transformation Components", ""]
-        
+
+        buf = io.StringIO()
+        buf.write("# Transformation Components\n\n")
+
         for i, transform in enumerate(transformations):
             component_name = transform.get('name', f'transform_{i}')
             component_type = self._get_component_type(transform)
-            
-            code_lines.extend([
-                f"# {component_name} ({component_type.value})",
-                f"def apply_{component_name.lower().replace(' ', '_')}(df):",
-                f"    \"\"\"Apply {component_type.value} transformation\"\"\""
-            ])
-            
+            func_name = _slugify(component_name)
+
+            buf.write(
+                f"# {component_name} ({component_type.value})\n"
+                f"def apply_{func_name}(df):\n"
+                f"    \"\"\"Apply {component_type.value} transformation\"\"\"\n"
+            )
+
             # Add specific transformation logic based on component type
             if component_type == ComponentType.DERIVED_COLUMN:
-                code_lines.extend(self._generate_derived_column_code(transform))
+                body_lines = self._generate_derived_column_code(transform)
             elif component_type == ComponentType.LOOKUP:
-                code_lines.extend(self._generate_lookup_code(transform))
+                body_lines = self._generate_lookup_code(transform)
             elif component_type == ComponentType.SORT:
-                code_lines.extend(self._generate_sort_code(transform))
+                body_lines = self._generate_sort_code(transform)
             elif component_type == ComponentType.AGGREGATE:
-                code_lines.extend(self._generate_aggregate_code(transform))
+                body_lines = self._generate_aggregate_code(transform)
             elif component_type == ComponentType.CONDITIONAL_SPLIT:
-                code_lines.extend(self._generate_conditional_split_code(transform))
+                body_lines = self._generate_conditional_split_code(transform)
             elif component_type == ComponentType.DATA_CONVERSION:
-                code_lines.extend(self._generate_data_conversion_code(transform))
+                body_lines = self._generate_data_conversion_code(transform)
             else:
-                code_lines.extend([
+                body_lines = [
                     "    # Generic transformation",
                     "    # TODO: Implement specific transformation logic",
                     "    return df"
-                ])
-            
-            code_lines.append("")
-        
-        return "\n".join(code_lines)
+                ]
+
+            buf.write("\n".join(body_lines))
+            buf.write("\n\n")
+
+        return buf.getvalue()[:-1]
     
     def _generate_destination_code(self, destinations: List[Dict[str, Any]]) -> str:
         """Generate Python code for destination components"""
         if not destinations:
             return "# No destination components found"
-        
-        code_lines = ["# Destination Components", ""]
-        
+
+        buf = io.StringIO()
+        buf.write("# Destination Components\n\n")
+
         for i, destination in enumerate(destinations):
             component_name = destination.get('name', f'destination_{i}')
             connection_string = destination.get('connection_string', '')
             table_name = destination.get('table_name', '')
             if_exists = destination.get('if_exists', 'replace')
-            
-            code_lines.extend([
-                f"# {component_name}",
-                f"def write_{component_name.lower().replace(' ', '_')}(df):",
-                f"    \"\"\"Write data to {component_name}\"\"\"",
-                f"    connection_string = '{connection_string}'",
-                f"    table_name = '{table_name}'",
-                f"    return write_destination_data(df, connection_string, table_name, if_exists='{if_exists}')",
-                ""
-            ])
-        
-        return "\n".join(code_lines)
+            chunksize = destination.get('chunksize', 10000)
+            method = destination.get('method', 'multi')
+            func_name = _slugify(component_name)
+
+            if self._is_duckdb_eligible(destination):
+                # File-shaped destinations load much faster through DuckDB's
+                # vectorized DataFrame ingestion than through row inserts
+                duckdb_path = destination.get('duckdb_path', f'{table_name or func_name}.duckdb')
+                buf.write(_DST_TMPL_DUCKDB.format_map({
+                    'name': component_name,
+                    'slug': func_name,
+                    'path': duckdb_path,
+                    'table': table_name or func_name
+                }))
+                continue
+
+            buf.write(_DST_TMPL.format_map({
+                'name': component_name,
+                'slug': func_name,
+                'cs': connection_string,
+                'table': table_name,
+                'if_exists': if_exists,
+                'chunksize': chunksize,
+                'method': method
+            }))
+
+        return buf.getvalue()[:-1]
     
     def _get_component_type(self, component: Dict[str, Any]) -> ComponentType:
         """Get the component type from component data"""
+        # Never cached on the component dict: the input belongs to the
+        # caller and must come back unchanged
         component_type = component.get('component_type', '').lower()
-        
-        if 'derived column' in component_type:
-            return ComponentType.DERIVED_COLUMN
-        elif 'lookup' in component_type:
-            return ComponentType.LOOKUP
-        elif 'sort' in component_type:
-            return ComponentType.SORT
-        elif 'aggregate' in component_type:
-            return ComponentType.AGGREGATE
-        elif 'conditional split' in component_type:
-            return ComponentType.CONDITIONAL_SPLIT
-        elif 'data conversion' in component_type:
-            return ComponentType.DATA_CONVERSION
-        else:
-            return ComponentType.UNKNOWN
+        match = _TYPE_RE.search(component_type)
+        return ComponentType[match.lastgroup] if match else ComponentType.UNKNOWN
     
     def _generate_derived_column_code(self, component: Dict[str, Any]) -> List[str]:
         """Generate code for derived column transformation"""
@@ -603,48 +888,44 @@ def convert_data_types(df, type_mappings):
         
         return code_lines
     
-    def _collect_imports(self, sources: List[Dict], transformations: List[Dict], destinations: List[Dict]) -> List[str]:
-        """Collect all required imports"""
-        imports = set()
-        
-        # Add imports from transformation rules
+    def _collect_imports_and_deps(
+        self, sources: List[Dict], transformations: List[Dict],
+        destinations: List[Dict], needs_engine: bool
+    ) -> Tuple[List[str], List[str]]:
+        """Collect required imports and dependencies in one pass"""
+        imports = {"pandas as pd", "logging"}
+        dependencies = {"pandas"}
+
+        # SQLAlchemy is only needed when a source or destination actually
+        # talks to a database; CSV-only flows skip its import cost entirely
+        if needs_engine:
+            imports.add("sqlalchemy")
+            dependencies.add("sqlalchemy")
+
         for transform in transformations:
             component_type = self._get_component_type(transform)
-            if component_type in self.transformation_rules:
-                rule = self.transformation_rules[component_type]
+            rule = self.transformation_rules.get(component_type)
+            if rule is not None:
                 imports.update(rule.imports)
-        
-        # Add common imports
-        imports.update([
-            "pandas as pd",
-            "sqlalchemy",
-            "logging"
-        ])
-        
-        return sorted(list(imports))
-    
-    def _collect_dependencies(self, sources: List[Dict], transformations: List[Dict], destinations: List[Dict]) -> List[str]:
-        """Collect all required dependencies"""
-        dependencies = set()
-        
-        # Add dependencies from transformation rules
-        for transform in transformations:
-            component_type = self._get_component_type(transform)
-            if component_type in self.transformation_rules:
-                rule = self.transformation_rules[component_type]
                 dependencies.update(rule.dependencies)
-        
-        # Add common dependencies
-        dependencies.update([
-            "pandas",
-            "sqlalchemy"
-        ])
-        
-        return sorted(list(dependencies))
+
+        # DuckDB is only required when a destination takes the DuckDB
+        # path; the same predicate drives emission in
+        # _generate_destination_code, so the two stay in sync
+        if any(self._is_duckdb_eligible(d) for d in destinations):
+            dependencies.add("duckdb")
+
+        return sorted(imports), sorted(dependencies)
     
-    def _generate_error_handling(self) -> str:
-        """Generate error handling code"""
-        return """
+    def _generate_error_handling(self, needs_engine: bool) -> str:
+        """Generate error handling code
+
+        The engine helper and its sqlalchemy import are only included
+        when the flow actually talks to a database, keeping file-only
+        scripts free of the sqlalchemy requirement.
+        """
+        prefix = _ENGINE_HELPER_CODE if needs_engine else "\n"
+        return prefix + """
 def handle_etl_error(error, context=""):
     \"\"\"Handle ETL errors\"\"\"
     import logging
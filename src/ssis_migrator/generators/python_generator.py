@@ -4,6 +4,14 @@ Python Script Generator - Generate Python ETL scripts from SSIS packages
 """
 
 import os
+import re
+import string
+import hashlib
+import json
+import pickle
+import jinja2
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
@@ -14,63 +22,67 @@ from ..core.error_handler import (
     ErrorSeverity, ErrorCategory
 )
 from ..parsers.dtsx_parser import SSISPackage
-from .data_flow_mapper import DataFlowMapper, DataFlowMapping
 
+# Bump whenever generated-script output changes so stale cache entries
+# are invalidated automatically
+CACHE_VERSION = 6
 
-@dataclass
-class PythonScript:
-    """Represents a generated Python ETL script"""
-    name: str
-    content: str
-    dependencies: List[str] = field(default_factory=list)
-    imports: List[str] = field(default_factory=list)
-    functions: List[str] = field(default_factory=list)
-    metadata: Dict[str, Any] = field(default_factory=dict)
+# Upper bound on memoized package-scan results per generator instance
+_SCAN_CACHE_LIMIT = 32
 
+# Standard ETL dependencies
+_STANDARD_DEPENDENCIES = frozenset((
+    "pandas",
+    "sqlalchemy",
+    "psycopg2-binary",  # PostgreSQL
+    "pymssql",          # SQL Server
+    "pymysql",          # MySQL
+    "cx_Oracle",        # Oracle
+    "pyodbc",           # ODBC connections
+    "configparser",     # Configuration management
+    "logging",          # Logging
+    "datetime",         # Date/time handling
+    "pathlib",          # Path handling
+    "json",             # JSON processing
+    "xml.etree.ElementTree",  # XML processing
+))
 
-@dataclass
-class GenerationResult:
-    """Result of script generation"""
-    success: bool
-    scripts: List[PythonScript] = field(default_factory=list)
-    errors: List[str] = field(default_factory=list)
-    warnings: List[str] = field(default_factory=list)
+# Connection-type classification: one regex pass per connection string
+# instead of a chain of substring probes
+_CONN_RE = re.compile(r'(sqlserver|mssql|postgres(?:ql)?|mysql|oracle|odbc)')
+_CONN_IMPORT_MAP = {
+    'sqlserver': 'pymssql',
+    'mssql': 'pymssql',
+    'postgresql': 'psycopg2',
+    'postgres': 'psycopg2',
+    'mysql': 'pymysql',
+    'oracle': 'cx_Oracle',
+    'odbc': 'pyodbc',
+}
 
+# Lowercase + space-to-underscore in a single pass
+_SLUG_TABLE = str.maketrans({c: c.lower() for c in string.ascii_uppercase} | {' ': '_'})
 
-class PythonScriptGenerator(LoggerMixin):
-    """Generator for Python ETL scripts from SSIS packages"""
-    
-    def __init__(self, error_handler: Optional[ErrorHandler] = None):
-        self.error_handler = error_handler or ErrorHandler()
-        self.logger.info("Python Script Generator initialized")
-        
-        # Initialize data flow mapper
-        self.data_flow_mapper = DataFlowMapper(error_handler=self.error_handler)
-        
-        # Standard ETL dependencies
-        self.standard_dependencies = [
-            "pandas",
-            "sqlalchemy",
-            "psycopg2-binary",  # PostgreSQL
-            "pymssql",          # SQL Server
-            "pymysql",          # MySQL
-            "cx_Oracle",        # Oracle
-            "pyodbc",           # ODBC connections
-            "configparser",     # Configuration management
-            "logging",          # Logging
-            "datetime",         # Date/time handling
-            "pathlib",          # Path handling
-            "json",             # JSON processing
-            "xml.etree.ElementTree",  # XML processing
-        ]
-        
-        # Template for main script structure
-        self.main_template = '''#!/usr/bin/env python3
+
+def _slug(s: str) -> str:
+    """Slugify a package/component name for file names"""
+    return s.translate(_SLUG_TABLE)
+
+
+# Jinja templates are compiled once at import time and re-rendered per
+# package; rendering is a single compiled-bytecode pass
+_ENV = jinja2.Environment(
+    trim_blocks=True, lstrip_blocks=True, autoescape=False,
+    cache_size=-1
+)
+
+# Template for main script structure
+_MAIN_TEMPLATE = '''#!/usr/bin/env python3
 """
-{script_name} - Generated ETL script from SSIS package: {package_name}
-Original SSIS Package: {package_name}
-Generated: {generation_date}
-Description: {description}
+{{ script_name }} - Generated ETL script from SSIS package: {{ package_name }}
+Original SSIS Package: {{ package_name }}
+Generated: {{ generation_date }}
+Description: {{ description }}
 """
 
 import sys
@@ -80,7 +92,7 @@ from pathlib import Path
 from datetime import datetime
 import traceback
 
-{imports}
+{{ imports }}
 
 # Configure logging
 def setup_logging():
@@ -89,7 +101,7 @@ def setup_logging():
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler('{log_file}'),
+            logging.FileHandler('{{ log_file }}'),
             logging.StreamHandler(sys.stdout)
         ]
     )
@@ -100,7 +112,7 @@ class Config:
     """Configuration management"""
     def __init__(self, config_file: str = None):
         self.config_file = config_file
-        self.settings = {{}}
+        self.settings = {}
         self._load_config()
     
     def _load_config(self):
@@ -118,7 +130,7 @@ class ConnectionManager:
     
     def __init__(self, config: Config):
         self.config = config
-        self.connections = {{}}
+        self.connections = {}
     
     def get_connection(self, connection_name: str):
         """Get database connection by name"""
@@ -135,13 +147,13 @@ class ConnectionManager:
         self.connections.clear()
 
 # Data processing functions
-{data_processing_functions}
+{{ data_processing_functions }}
 
 # Main execution
 def main():
     """Main execution function"""
     logger = setup_logging()
-    logger.info("Starting ETL process for package: {package_name}")
+    logger.info("Starting ETL process for package: {{ package_name }}")
     
     try:
         # Initialize configuration
@@ -152,14 +164,22 @@ def main():
         
         # Execute ETL steps
         logger.info("Executing ETL steps...")
-        
-        {main_execution_steps}
-        
+
+{% for component in data_flow_components %}
+        process_data_flow_{{ component.get('component_id', 'component_' ~ loop.index0) }}(None, None, config)
+{% endfor %}
+{% for task in control_flow_tasks %}
+        execute_task_{{ task.get('task_id', 'task_' ~ loop.index0) }}(config)
+{% endfor %}
+{% if control_flow_tasks %}
+        execute_control_flow(config)
+{% endif %}
+
         logger.info("ETL process completed successfully")
         return 0
         
     except Exception as e:
-        logger.error(f"ETL process failed: {{str(e)}}")
+        logger.error(f"ETL process failed: {str(e)}")
         logger.error(traceback.format_exc())
         return 1
     
@@ -171,13 +191,14 @@ def main():
 if __name__ == "__main__":
     sys.exit(main())
 '''
-        
-        # Template for data flow components
-        self.data_flow_template = '''
-def process_data_flow_{component_id}(data_source, data_destination, config):
-    """Process data flow component: {component_name}"""
+
+# Template for data flow components
+_DATA_FLOW_TEMPLATE = '''
+def process_data_flow_{{ component_id }}(data_source, data_destination, config):
+    """Process data flow component: {{ component_name }}"""
     logger = logging.getLogger(__name__)
-    logger.info(f"Processing data flow: {{component_name}}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Processing data flow: {{ component_name }}")
     
     try:
         # TODO: Implement specific data flow logic
@@ -192,16 +213,16 @@ def process_data_flow_{component_id}(data_source, data_destination, config):
         # Example: Write to destination
         # df.to_sql(table_name, connection, if_exists='append', index=False)
         
-        logger.info(f"Data flow {{component_name}} completed successfully")
+        logger.info("Data flow {{ component_name }} completed successfully")
         return True
         
     except Exception as e:
-        logger.error(f"Data flow {{component_name}} failed: {{str(e)}}")
+        logger.error("Data flow {{ component_name }} failed: %s", str(e))
         raise
 '''
-        
-        # Template for control flow tasks
-        self.control_flow_template = '''
+
+# Template for control flow tasks
+_CONTROL_FLOW_TEMPLATE = '''
 def execute_control_flow(config):
     """Execute control flow tasks"""
     logger = logging.getLogger(__name__)
@@ -215,10 +236,87 @@ def execute_control_flow(config):
         return True
         
     except Exception as e:
-        logger.error(f"Control flow execution failed: {{str(e)}}")
+        logger.error(f"Control flow execution failed: {str(e)}")
         raise
 '''
-    
+
+_MAIN_TPL = _ENV.from_string(_MAIN_TEMPLATE)
+_DF_TPL = _ENV.from_string(_DATA_FLOW_TEMPLATE)
+_CF_TPL = _ENV.from_string(_CONTROL_FLOW_TEMPLATE)
+
+
+@lru_cache(maxsize=4096)
+def _render_df_fragment(component_id: str, component_name: str) -> str:
+    """Render a data flow placeholder function, cached per (id, name)
+
+    Packages with many near-duplicate components only pay for the Jinja
+    render once per distinct pair.
+    """
+    return _DF_TPL.render(
+        component_id=component_id,
+        component_name=component_name
+    )
+
+
+@dataclass(slots=True)
+class PythonScript:
+    """Represents a generated Python ETL script"""
+    name: str
+    content: str
+    dependencies: List[str] = field(default_factory=list)
+    imports: List[str] = field(default_factory=list)
+    functions: List[str] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class GenerationResult:
+    """Result of script generation"""
+    success: bool
+    scripts: List[PythonScript] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+
+class PythonScriptGenerator(LoggerMixin):
+    """Generator for Python ETL scripts from SSIS packages"""
+
+    def __init__(self, error_handler: Optional[ErrorHandler] = None):
+        self.error_handler = error_handler or ErrorHandler()
+        self.logger.info("Python Script Generator initialized")
+
+        # Per-package scan results, keyed by content fingerprint so both
+        # the main-script and requirements paths share one traversal.
+        # id(package) is not a safe key: ids are recycled once a package
+        # is garbage collected, so a new package could inherit a dead
+        # one's cached scan
+        self._pkg_scan_cache: Dict[str, tuple] = {}
+
+        # Generation timestamp shared across one generate_scripts batch
+        self._batch_timestamp: Optional[str] = None
+
+        # Data flow mapper is constructed lazily on first use so that
+        # importing this module (e.g. for the PythonScript dataclasses)
+        # doesn't pull in the full mapper
+        self._data_flow_mapper = None
+
+        # Standard ETL dependencies
+        self.standard_dependencies = list(_STANDARD_DEPENDENCIES)
+        
+        # Module-level templates are pre-compiled once; per-instance we
+        # only keep aliases for introspection
+        self.main_template = _MAIN_TEMPLATE
+        self.data_flow_template = _DATA_FLOW_TEMPLATE
+        self.control_flow_template = _CONTROL_FLOW_TEMPLATE
+
+    @property
+    def data_flow_mapper(self):
+        """Data flow mapper, imported and built on first access"""
+        if self._data_flow_mapper is None:
+            from .data_flow_mapper import DataFlowMapper
+            self._data_flow_mapper = DataFlowMapper(error_handler=self.error_handler)
+        return self._data_flow_mapper
+
     def generate_scripts(self, package: SSISPackage, output_dir: str) -> GenerationResult:
         """
         Generate Python ETL scripts from SSIS package
@@ -231,25 +329,57 @@ def execute_control_flow(config):
             GenerationResult with generated scripts
         """
         try:
-            self.logger.info(f"Generating Python scripts for package: {package.name}")
-            
+            self.logger.info("Generating Python scripts for package: %s", package.name)
+
+            # Short-circuit on a warm cache: identical package content
+            # always produces identical scripts
+            cache_path = (
+                Path(output_dir) / ".ssis_cache"
+                / f"{self._package_fingerprint(package)}.pkl"
+            )
+            if cache_path.exists():
+                try:
+                    scripts = pickle.loads(cache_path.read_bytes())
+                except Exception as cache_error:
+                    # Unreadable or stale entry (e.g. written by an older
+                    # build); regenerate instead of failing the batch
+                    self.logger.warning("Ignoring unreadable script cache: %s", str(cache_error))
+                else:
+                    self.logger.info(
+                        f"Loaded {len(scripts)} cached scripts for package {package.name}"
+                    )
+                    return GenerationResult(
+                        success=True,
+                        scripts=scripts,
+                        warnings=[f"Generated {len(scripts)} scripts for package {package.name}"]
+                    )
+
+            # One timestamp per batch; bulk runs don't need per-script
+            # wall-clock precision
+            self._batch_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
             scripts = []
-            
+
             # Generate main ETL script
             main_script = self._generate_main_script(package)
             scripts.append(main_script)
             
-            # Generate data flow scripts
-            for component in package.data_flow_components:
-                component_script = self._generate_data_flow_script(component, package)
-                if component_script:
-                    scripts.append(component_script)
-            
-            # Generate control flow scripts
-            for task in package.control_flow_tasks:
-                task_script = self._generate_control_flow_script(task, package)
-                if task_script:
-                    scripts.append(task_script)
+            # Generate data flow and control flow scripts; each one is
+            # independent, so fan them out over a thread pool and collect
+            # results in submission order
+            with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 2))) as executor:
+                df_futures = [
+                    executor.submit(self._generate_data_flow_script, component, package)
+                    for component in package.data_flow_components
+                ]
+                cf_futures = [
+                    executor.submit(self._generate_control_flow_script, task, package)
+                    for task in package.control_flow_tasks
+                ]
+                for future in df_futures + cf_futures:
+                    script = future.result()
+                    if script:
+                        scripts.append(script)
             
             # Generate configuration script
             config_script = self._generate_config_script(package)
@@ -261,8 +391,13 @@ def execute_control_flow(config):
             if requirements_script:
                 scripts.append(requirements_script)
             
-            self.logger.info(f"Generated {len(scripts)} Python scripts")
-            
+            self.logger.info(
+                "Generated %d scripts (%d data flow, %d control flow)",
+                len(scripts), len(package.data_flow_components), len(package.control_flow_tasks)
+            )
+
+            self._write_script_cache(cache_path, scripts)
+
             return GenerationResult(
                 success=True,
                 scripts=scripts,
@@ -283,7 +418,138 @@ def execute_control_flow(config):
                 )
             )
             return GenerationResult(False, errors=[str(error)])
-    
+        finally:
+            self._batch_timestamp = None
+
+    def generate_scripts_streaming(self, package: SSISPackage, output_dir: str) -> GenerationResult:
+        """
+        Generate Python ETL scripts and stream them straight to disk
+
+        Unlike generate_scripts, rendered content is written to
+        output_dir as it is produced instead of being held in memory;
+        the returned scripts are a manifest only (content is empty).
+
+        Args:
+            package: Parsed SSIS package
+            output_dir: Output directory for generated scripts
+
+        Returns:
+            GenerationResult with script manifests (name + metadata)
+        """
+        try:
+            self.logger.info("Streaming Python scripts for package: %s", package.name)
+
+            out_path = Path(output_dir)
+            out_path.mkdir(parents=True, exist_ok=True)
+
+            self._batch_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+            manifests = []
+
+            # Main script: render through Jinja's streaming API so the
+            # full content never exists as one string
+            script_name = f"{package.name.replace(' ', '_')}_main.py"
+            with open(out_path / script_name, 'w', encoding='utf-8') as f:
+                _MAIN_TPL.stream(
+                    script_name=script_name,
+                    package_name=package.name,
+                    generation_date=self._batch_timestamp,
+                    description=package.description or "ETL script generated from SSIS package",
+                    imports="\n".join(self._collect_imports(package)),
+                    log_file=f"{_slug(package.name)}.log",
+                    data_processing_functions=self._generate_data_processing_functions(package),
+                    data_flow_components=package.data_flow_components,
+                    control_flow_tasks=package.control_flow_tasks
+                ).dump(f)
+            manifests.append(PythonScript(
+                name=script_name,
+                content="",
+                dependencies=self._collect_dependencies(package),
+                imports=self._collect_imports(package),
+                metadata={
+                    "package_name": package.name,
+                    "package_version": package.version,
+                    "component_count": len(package.data_flow_components) + len(package.control_flow_tasks)
+                }
+            ))
+
+            # Remaining scripts are small; generate and flush each one
+            # immediately, keeping only the manifest
+            pending = []
+            for component in package.data_flow_components:
+                pending.append(self._generate_data_flow_script(component, package))
+            for task in package.control_flow_tasks:
+                pending.append(self._generate_control_flow_script(task, package))
+            pending.append(self._generate_config_script(package))
+            pending.append(self._generate_requirements_script(package))
+
+            for script in pending:
+                if not script:
+                    continue
+                (out_path / script.name).write_text(script.content, encoding='utf-8')
+                script.content = ""
+                manifests.append(script)
+
+            self.logger.info("Wrote %d Python scripts to %s", len(manifests), output_dir)
+
+            return GenerationResult(
+                success=True,
+                scripts=manifests,
+                warnings=[f"Generated {len(manifests)} scripts for package {package.name}"]
+            )
+
+        except Exception as e:
+            error = ConversionError(
+                f"Failed to stream Python scripts: {str(e)}",
+                severity=ErrorSeverity.HIGH,
+                source_component="PythonGenerator"
+            )
+            self.error_handler.handle_error(
+                error,
+                context=create_error_context(
+                    component="PythonGenerator",
+                    operation="generate_scripts_streaming"
+                )
+            )
+            return GenerationResult(False, errors=[str(error)])
+        finally:
+            self._batch_timestamp = None
+
+    def _package_fingerprint(self, package: SSISPackage) -> str:
+        """Compute a stable content hash over the package fields that drive generation"""
+        # Every field that any _generate_* method renders must be hashed,
+        # otherwise two packages differing only in an omitted field would
+        # share a cache entry and the second one would get the first
+        # one's scripts
+        canonical = {
+            "cache_version": CACHE_VERSION,
+            "name": package.name,
+            "version": package.version,
+            "description": package.description,
+            "creation_date": package.creation_date,
+            "creator": package.creator,
+            "connection_managers": package.connection_managers,
+            "variables": package.variables,
+            "data_flow_components": package.data_flow_components,
+            "control_flow_tasks": package.control_flow_tasks,
+            "environment_variables": package.environment_variables,
+        }
+        # No default= hook: an unserializable value means the canonical
+        # form is ambiguous, and a loud TypeError beats a silent str()
+        # collapse that would fingerprint distinct packages identically
+        payload = json.dumps(canonical, sort_keys=True).encode()
+        return hashlib.sha256(payload).hexdigest()
+
+    def _write_script_cache(self, cache_path: Path, scripts: List[PythonScript]) -> None:
+        """Persist generated scripts for warm reruns (atomic write, best effort)"""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            tmp_path.write_bytes(pickle.dumps(scripts))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self.logger.warning(f"Could not write script cache: {str(e)}")
+
     def _generate_main_script(self, package: SSISPackage) -> PythonScript:
         """Generate main ETL script"""
         script_name = f"{package.name.replace(' ', '_')}_main.py"
@@ -293,20 +559,19 @@ def execute_control_flow(config):
         
         # Generate data processing functions
         data_processing_functions = self._generate_data_processing_functions(package)
-        
-        # Generate main execution steps
-        main_execution_steps = self._generate_main_execution_steps(package)
-        
-        # Format the template
-        content = self.main_template.format(
+
+        # Render the pre-compiled template; the execution-step loops run
+        # inline in the template, so one render produces the whole script
+        content = _MAIN_TPL.render(
             script_name=script_name,
             package_name=package.name,
-            generation_date=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            generation_date=self._batch_timestamp or datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             description=package.description or "ETL script generated from SSIS package",
             imports="\n".join(imports),
-            log_file=f"{package.name.lower().replace(' ', '_')}.log",
+            log_file=f"{_slug(package.name)}.log",
             data_processing_functions=data_processing_functions,
-            main_execution_steps=main_execution_steps
+            data_flow_components=package.data_flow_components,
+            control_flow_tasks=package.control_flow_tasks
         )
         
         return PythonScript(
@@ -321,134 +586,92 @@ def execute_control_flow(config):
             }
         )
     
-    def _collect_imports(self, package: SSISPackage) -> List[str]:
-        """Collect required imports based on package components"""
-        imports = [
+    def _scan_package(self, package: SSISPackage) -> tuple:
+        """Walk the package once and collect (imports, dependencies)
+
+        Both lists are derived from the same connection-manager and
+        data-flow traversal, so they are computed together and cached per
+        package object.
+        """
+        key = self._package_fingerprint(package)
+        cached = self._pkg_scan_cache.get(key)
+        if cached is not None:
+            return cached
+
+        imports = {
             "pandas",
             "sqlalchemy",
             "configparser",
             "logging",
             "datetime",
             "traceback"
-        ]
-        
+        }
+        extras: set = set()
+
         # Add imports based on connection managers
         for conn in package.connection_managers:
-            conn_type = conn.get('connection_type', '').lower()
-            if 'sqlserver' in conn_type or 'mssql' in conn_type:
-                imports.append("pymssql")
-            elif 'postgresql' in conn_type or 'postgres' in conn_type:
-                imports.append("psycopg2")
-            elif 'mysql' in conn_type:
-                imports.append("pymysql")
-            elif 'oracle' in conn_type:
-                imports.append("cx_Oracle")
-            elif 'odbc' in conn_type:
-                imports.append("pyodbc")
-        
-        # Add imports based on data flow components
+            match = _CONN_RE.search(conn.get('connection_type', '').lower())
+            if match:
+                imports.add(_CONN_IMPORT_MAP[match.group(1)])
+
+        # Add imports and dependencies based on data flow components
         for component in package.data_flow_components:
             component_type = component.get('component_type', '').lower()
             if 'file' in component_type:
-                imports.extend([
+                imports.update((
                     "csv",
                     "json",
                     "xml.etree.ElementTree"
-                ])
+                ))
+                extras.update(('openpyxl', 'xlrd'))  # Excel support
             elif 'transform' in component_type:
-                imports.append("numpy")
-        
-        # Remove duplicates and sort
-        return sorted(list(set(imports)))
-    
-    def _collect_dependencies(self, package: SSISPackage) -> List[str]:
-        """Collect required dependencies"""
-        dependencies = self.standard_dependencies.copy()
-        
-        # Add specific dependencies based on components
-        for component in package.data_flow_components:
-            component_type = component.get('component_type', '').lower()
-            if 'file' in component_type:
-                dependencies.extend(['openpyxl', 'xlrd'])  # Excel support
+                imports.add("numpy")
             elif 'api' in component_type:
-                dependencies.append('requests')
+                extras.add('requests')
             elif 'ftp' in component_type:
-                dependencies.append('ftplib')
-        
-        return sorted(list(set(dependencies)))
+                extras.add('ftplib')
+
+        result = (sorted(imports), sorted(_STANDARD_DEPENDENCIES | extras))
+        if len(self._pkg_scan_cache) >= _SCAN_CACHE_LIMIT:
+            self._pkg_scan_cache.pop(next(iter(self._pkg_scan_cache)))
+        self._pkg_scan_cache[key] = result
+        return result
+
+    def _collect_imports(self, package: SSISPackage) -> List[str]:
+        """Collect required imports based on package components"""
+        return self._scan_package(package)[0]
+
+    def _collect_dependencies(self, package: SSISPackage) -> List[str]:
+        """Collect required dependencies"""
+        return self._scan_package(package)[1]
     
     def _generate_data_processing_functions(self, package: SSISPackage) -> str:
         """Generate data processing functions using data flow mapper"""
         try:
             # Use data flow mapper to generate enhanced transformation code
             data_flow_mapping = self.data_flow_mapper.map_data_flow(package.data_flow_components)
-            
-            # Combine all the generated code
-            functions = []
-            
-            # Add error handling functions
-            if data_flow_mapping.error_handling:
-                functions.append(data_flow_mapping.error_handling)
-            
-            # Add transformation functions from data flow mapper
-            if data_flow_mapping.source_code:
-                functions.append(data_flow_mapping.source_code)
-            
-            if data_flow_mapping.transformation_code:
-                functions.append(data_flow_mapping.transformation_code)
-            
-            if data_flow_mapping.destination_code:
-                functions.append(data_flow_mapping.destination_code)
-            
-            # Add validation functions
-            if data_flow_mapping.validation_code:
-                functions.append(data_flow_mapping.validation_code)
-            
-            return "\n".join(functions) if functions else "# No data flow components found"
-            
+
+            # Join the non-empty code sections in one pass
+            sections = (code for code in (
+                data_flow_mapping.error_handling,
+                data_flow_mapping.source_code,
+                data_flow_mapping.transformation_code,
+                data_flow_mapping.destination_code,
+                data_flow_mapping.validation_code,
+            ) if code)
+
+            return "\n".join(sections) or "# No data flow components found"
+
         except Exception as e:
-            self.logger.warning(f"Data flow mapping failed: {str(e)}, using basic template")
-            # Fall back to basic template
-            functions = []
-            for i, component in enumerate(package.data_flow_components):
-                component_id = component.get('component_id', f'component_{i}')
-                component_name = component.get('component_name', f'DataFlow_{i}')
-                
-                function_content = self.data_flow_template.format(
-                    component_id=component_id,
-                    component_name=component_name
-                )
-                functions.append(function_content)
-            
-            return "\n".join(functions)
-    
-    def _generate_main_execution_steps(self, package: SSISPackage) -> str:
-        """Generate main execution steps"""
-        steps = []
-        
-        # Add data flow execution steps
-        for i, component in enumerate(package.data_flow_components):
-            component_id = component.get('component_id', f'component_{i}')
-            component_name = component.get('name', f'DataFlow_{i}')
-            steps.append(f"        process_data_flow_{component_id}(None, None, config)")
-        
-        # Add control flow execution steps
-        for i, task in enumerate(package.control_flow_tasks):
-            task_id = task.get('task_id', f'task_{i}')
-            task_name = task.get('name', f'Task_{i}')
-            steps.append(f"        execute_task_{task_id}(config)")
-        
-        # Add execute_control_flow call if there are control flow tasks
-        if package.control_flow_tasks:
-            steps.append("        execute_control_flow(config)")
-        
-        return "\n".join(steps)
+            self.logger.warning("Data flow mapping failed: %s, using basic template", str(e))
+            # Fall back to the shared placeholder templates
+            return self._generate_data_flow_functions(package)
     
     def _generate_data_flow_script(self, component: Dict[str, Any], package: SSISPackage) -> Optional[PythonScript]:
         """Generate script for a specific data flow component"""
         try:
             component_name = component.get('component_name', 'UnknownComponent')
-            script_name = f"{component_name.lower().replace(' ', '_')}_dataflow.py"
+            script_name = f"{_slug(component_name)}_dataflow.py"
             
             # Generate component-specific logic
             content = self._generate_component_specific_logic(component, package)
@@ -476,7 +699,7 @@ def execute_control_flow(config):
         """Generate script for a specific control flow task"""
         try:
             task_name = task.get('task_name', 'UnknownTask')
-            script_name = f"{task_name.lower().replace(' ', '_')}_task.py"
+            script_name = f"{_slug(task_name)}_task.py"
             
             # Generate task-specific logic
             content = self._generate_task_specific_logic(task, package)
@@ -503,7 +726,7 @@ def execute_control_flow(config):
     def _generate_config_script(self, package: SSISPackage) -> Optional[PythonScript]:
         """Generate configuration script"""
         try:
-            script_name = f"{package.name.lower().replace(' ', '_')}_config.py"
+            script_name = f"{_slug(package.name)}_config.py"
             
             content = f'''#!/usr/bin/env python3
 """
@@ -511,19 +734,13 @@ Configuration for {package.name} ETL package
 """
 
 # Database connections
-DATABASE_CONNECTIONS = {{
-    {self._format_connections(package.connection_managers)}
-}}
+DATABASE_CONNECTIONS = {self._format_connections(package.connection_managers)}
 
 # Variables
-VARIABLES = {{
-    {self._format_variables(package.variables)}
-}}
+VARIABLES = {self._format_variables(package.variables)}
 
 # Environment variables
-ENVIRONMENT_VARIABLES = {{
-    {self._format_environment_variables(package.environment_variables)}
-}}
+ENVIRONMENT_VARIABLES = {self._format_environment_variables(package.environment_variables)}
 
 # Package metadata
 PACKAGE_METADATA = {{
@@ -557,10 +774,12 @@ PACKAGE_METADATA = {{
     def _generate_requirements_script(self, package: SSISPackage) -> PythonScript:
         """Generate requirements.txt file"""
         dependencies = self._collect_dependencies(package)
-        
-        content = "# Requirements for {package.name} ETL package\n"
-        content += "# Generated from SSIS package\n\n"
-        content += "\n".join(dependencies)
+
+        content = (
+            f"# Requirements for {package.name} ETL package\n"
+            "# Generated from SSIS package\n\n"
+            + "\n".join(dependencies) + "\n"
+        )
         
         return PythonScript(
             name="requirements.txt",
@@ -572,86 +791,73 @@ PACKAGE_METADATA = {{
             }
         )
     
+    # Type-substring -> generator method dispatch, probed in order
+    _COMPONENT_DISPATCH = (
+        ('source', '_generate_source_component_logic'),
+        ('destination', '_generate_destination_component_logic'),
+        ('transform', '_generate_transform_component_logic'),
+    )
+    _TASK_DISPATCH = (
+        ('sql', '_generate_sql_task_logic'),
+        ('script', '_generate_script_task_logic'),
+        ('file', '_generate_file_task_logic'),
+    )
+
     def _generate_component_specific_logic(self, component: Dict[str, Any], package: SSISPackage) -> str:
         """Generate component-specific logic"""
         component_type = component.get('component_type', '').lower()
-        
-        if 'source' in component_type:
-            return self._generate_source_component_logic(component, package)
-        elif 'destination' in component_type:
-            return self._generate_destination_component_logic(component, package)
-        elif 'transform' in component_type:
-            return self._generate_transform_component_logic(component, package)
-        else:
-            return self._generate_generic_component_logic(component, package)
-    
+        for needle, meth in self._COMPONENT_DISPATCH:
+            if needle in component_type:
+                return getattr(self, meth)(component, package)
+        return self._generate_generic_component_logic(component, package)
+
     def _generate_task_specific_logic(self, task: Dict[str, Any], package: SSISPackage) -> str:
         """Generate task-specific logic"""
         task_type = task.get('task_type', '').lower()
-        
-        if 'sql' in task_type:
-            return self._generate_sql_task_logic(task, package)
-        elif 'script' in task_type:
-            return self._generate_script_task_logic(task, package)
-        elif 'file' in task_type:
-            return self._generate_file_task_logic(task, package)
-        else:
-            return self._generate_generic_task_logic(task, package)
+        for needle, meth in self._TASK_DISPATCH:
+            if needle in task_type:
+                return getattr(self, meth)(task, package)
+        return self._generate_generic_task_logic(task, package)
     
     def _format_connections(self, connections: List[Dict[str, Any]]) -> str:
-        """Format connection managers for config"""
-        formatted = []
-        for conn in connections:
-            conn_name = conn.get('name', 'Unknown')
-            conn_type = conn.get('type', conn.get('connection_type', 'Unknown'))
-            conn_string = conn.get('connection_string', '')
-            formatted.append(f'    "{conn_name}": {{"type": "{conn_type}", "connection_string": "{conn_string}"}}')
-        return ",\n".join(formatted) if formatted else "    # No connections defined"
-    
+        """Format connection managers as a config dict literal"""
+        payload = {
+            conn.get('name', 'Unknown'): {
+                "type": conn.get('type', conn.get('connection_type', 'Unknown')),
+                "connection_string": conn.get('connection_string', '')
+            }
+            for conn in connections
+        }
+        return json.dumps(payload, indent=4)
+
     def _format_variables(self, variables: List[Dict[str, Any]]) -> str:
-        """Format variables for config"""
-        formatted = []
-        for var in variables:
-            var_name = var.get('name', 'Unknown')
-            var_value = var.get('value', '')
-            var_type = var.get('type', 'String')
-            formatted.append(f'    "{var_name}": "{{"value": "{var_value}", "type": "{var_type}"}}"')
-        return ",\n".join(formatted) if formatted else "    # No variables defined"
-    
+        """Format variables as a config dict literal"""
+        payload = {
+            var.get('name', 'Unknown'): {
+                "value": var.get('value', ''),
+                "type": var.get('type', 'String')
+            }
+            for var in variables
+        }
+        return json.dumps(payload, indent=4)
+
     def _format_environment_variables(self, env_vars: Dict[str, str]) -> str:
-        """Format environment variables for config"""
-        formatted = []
-        for key, value in env_vars.items():
-            formatted.append(f'    "{key}": "{value}"')
-        return ",\n".join(formatted) if formatted else "    # No environment variables defined"
+        """Format environment variables as a config dict literal"""
+        # Coerce both sides to str: parsers can hand back non-string
+        # values, and only a str->str dict is guaranteed to round-trip
+        # through JSON as a valid Python literal. Also tolerates None.
+        payload = {str(name): str(value) for name, value in (env_vars or {}).items()}
+        return json.dumps(payload, indent=4)
     
     def _generate_data_flow_functions(self, package: SSISPackage) -> str:
-        """Generate data flow functions"""
-        functions = []
-        for i, component in enumerate(package.data_flow_components):
-            component_id = component.get('component_id', f'component_{i}')
-            component_name = component.get('name', f'DataFlow_{i}')
-            
-            function_content = f'''
-def process_data_flow_{component_id}(data_source, data_destination, config):
-    """Process data flow component: {component_name}"""
-    logger = logging.getLogger(__name__)
-    logger.info(f"Processing data flow: {{component_name}}")
-    
-    try:
-        # TODO: Implement specific data flow logic for {component_name}
-        # This is a placeholder for the actual data processing logic
-        
-        logger.info(f"Data flow {{component_name}} completed successfully")
-        return True
-        
-    except Exception as e:
-        logger.error(f"Data flow {{component_name}} failed: {{str(e)}}")
-        raise
-'''
-            functions.append(function_content)
-        
-        return "\n".join(functions) if functions else "# No data flow components found"
+        """Generate placeholder data flow functions"""
+        return "\n".join(
+            _render_df_fragment(
+                component.get('component_id', f'component_{i}'),
+                component.get('component_name', component.get('name', f'DataFlow_{i}'))
+            )
+            for i, component in enumerate(package.data_flow_components)
+        ) or "# No data flow components found"
     
     def _generate_control_flow_functions(self, package: SSISPackage) -> str:
         """Generate control flow functions"""
@@ -681,33 +887,34 @@ def execute_task_{task_id}(config):
 '''
             functions.append(function_content)
         
-        # Add the main execute_control_flow function
+        # Add the main execute_control_flow function; accumulate parts and
+        # join once instead of repeated string concatenation
         if package.control_flow_tasks:
-            control_flow_function = '''
+            parts = ['''
 def execute_control_flow(config):
     """Execute all control flow tasks"""
     logger = logging.getLogger(__name__)
     logger.info("Executing control flow tasks")
-    
+
     try:
         # Execute all tasks in sequence
-'''
+''']
             for i, task in enumerate(package.control_flow_tasks):
                 task_id = task.get('task_id', f'task_{i}')
                 task_name = task.get('name', f'Task_{i}')
-                control_flow_function += f'''
+                parts.append(f'''
         # Execute task: {task_name}
         execute_task_{task_id}(config)
-'''
-            control_flow_function += '''
+''')
+            parts.append('''
         logger.info("All control flow tasks completed successfully")
         return True
-        
+
     except Exception as e:
         logger.error(f"Control flow execution failed: {str(e)}")
         raise
-'''
-            functions.append(control_flow_function)
+''')
+            functions.append("".join(parts))
         
         return "\n".join(functions) if functions else "# No control flow tasks found"
     
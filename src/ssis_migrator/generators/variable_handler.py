@@ -5,15 +5,42 @@ Variable and Parameter Handler - Handle SSIS variables and parameters in Python
 
 import re
 import os
-from typing import Dict, List, Any, Optional, Union
+import sys
+import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Dict, List, Any, Callable, Optional, Union
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
 from ..core.logger import LoggerMixin
 from ..core.error_handler import (
     ErrorHandler, ConversionError, create_error_context,
     ErrorSeverity, ErrorCategory
 )
+from ._variable_runtime import CHECKERS as _CHECKERS
+from ._variable_runtime import COERCERS as _COERCERS
+from ._variable_runtime import PARAM_PATTERN as _PARAM_PATTERN
+
+# Field orders for one-pass extraction of SSIS dict payloads
+_VAR_KEYS = ('name', 'value', 'type', 'scope', 'description',
+             'read_only', 'required', 'default_value', 'validation_rules')
+_PARAM_KEYS = ('name', 'value', 'type', 'direction', 'description',
+               'required', 'default_value', 'validation_rules')
+
+
+# Names containing any of these indicate a secret value
+_SECRET_RE = re.compile(r'password|passwd|pwd|secret|key|token|auth', re.IGNORECASE)
+
+# Upper bound on memoized handling results per handler instance
+_RESULT_CACHE_LIMIT = 128
+
+# Item counts below these stay on the sequential path; thread start-up
+# costs more than the work for typical packages
+_PARALLEL_CONVERT_THRESHOLD = 500
+_PARALLEL_CODEGEN_THRESHOLD = 100
 
 
 class VariableScope(Enum):
@@ -36,7 +63,155 @@ class VariableType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Converters and validators shared with generated code, re-keyed by enum
+# member so the hot paths resolve them with one dict lookup
+_TYPED = (VariableType.INT, VariableType.FLOAT,
+          VariableType.BOOLEAN, VariableType.DATETIME)
+_CONVERTERS: Dict[VariableType, Callable[[Any], Any]] = {
+    t: _COERCERS[t.value] for t in _TYPED
+}
+_VALIDATORS: Dict[VariableType, Callable[[Any], bool]] = {
+    t: _CHECKERS[t.value] for t in _TYPED
+}
+
+
+# Validation helpers emitted with every package; no data dependency,
+# so the text is joined once at import time
+_VALIDATION_CODE = "\n".join((
+    "# Validation functions",
+    "",
+    "# Inlined from the migration tool's variable runtime so generated",
+    "# scripts run without ssis_migrator installed",
+    "import re as _re",
+    "from datetime import datetime as _datetime",
+    "",
+    "# Pattern for parameter substitution: $(ParameterName) or @[User::VariableName]",
+    "_PARAM_PATTERN = _re.compile(r'\\$\\(([^)]+)\\)|@\\[User::([^\\]]+)\\]')",
+    "",
+    "# Strings recognised as booleans",
+    "_BOOL_SET = frozenset(('true', 'false', '1', '0', 'yes', 'no'))",
+    "",
+    "def validate_variable_type(value, expected_type: str) -> bool:",
+    "    \"\"\"Check whether value is acceptable for the expected type\"\"\"",
+    "    try:",
+    "        if expected_type == 'int':",
+    "            int(value)",
+    "        elif expected_type == 'float':",
+    "            float(value)",
+    "        elif expected_type == 'boolean':",
+    "            if isinstance(value, str):",
+    "                return value.lower() in _BOOL_SET",
+    "            return isinstance(value, bool)",
+    "        elif expected_type == 'datetime':",
+    "            if isinstance(value, str):",
+    "                if value.endswith('Z'):",
+    "                    value = value[:-1] + '+00:00'",
+    "                _datetime.fromisoformat(value)",
+    "        return True",
+    "    except (ValueError, TypeError):",
+    "        return False",
+    "",
+    "def validate_required_variables(variables: dict, required_vars: list) -> list:",
+    "    \"\"\"Validate required variables\"\"\"",
+    "    missing = []",
+    "    for var_name in required_vars:",
+    "        if var_name not in variables or not variables[var_name]:",
+    "            missing.append(var_name)",
+    "    return missing",
+    "",
+    "def validate_parameter_substitution(text: str, parameters: dict) -> str:",
+    "    \"\"\"Validate and perform parameter substitution\"\"\"",
+    "    def replace_param(match):",
+    "        param_name = match.group(1) or match.group(2)",
+    "        if param_name in parameters:",
+    "            return str(parameters[param_name])",
+    "        else:",
+    "            raise ValueError(f\"Parameter {param_name} not found\")",
+    "",
+    "    return _PARAM_PATTERN.sub(replace_param, text)",
+    ""
+))
+
+
+# Static sections of the generated VariableManager class
+_VARIABLE_CODE_HEADER = (
+    "# Variable and Parameter Handling",
+    "",
+    "class VariableManager:",
+    "    \"\"\"Manage SSIS variables and parameters\"\"\"",
+    "",
+    "    def __init__(self):",
+    "        self.variables = {}",
+    "        self.parameters = {}",
+    "        self._load_variables()",
+    "        self._load_parameters()",
+    "        self._load_environment_variables()",
+    "",
+    "    def _load_variables(self):",
+    "        \"\"\"Load variables from configuration\"\"\"",
+)
+
+_PARAMETER_SECTION_HEADER = (
+    "",
+    "    def _load_parameters(self):",
+    "        \"\"\"Load parameters from configuration\"\"\"",
+)
+
+_ENV_VAR_SECTION_HEADER = (
+    "",
+    "    def _load_environment_variables(self):",
+    "        \"\"\"Load environment variables\"\"\"",
+)
+
+_VARIABLE_CODE_FOOTER = (
+    "",
+    "    def get_variable(self, name: str, default=None):",
+    "        \"\"\"Get variable value\"\"\"",
+    "        return self.variables.get(name, default)",
+    "",
+    "    def set_variable(self, name: str, value: Any):",
+    "        \"\"\"Set variable value\"\"\"",
+    "        self.variables[name] = value",
+    "",
+    "    def get_parameter(self, name: str, default=None):",
+    "        \"\"\"Get parameter value\"\"\"",
+    "        return self.parameters.get(name, default)",
+    "",
+    "    def set_parameter(self, name: str, value: Any):",
+    "        \"\"\"Set parameter value\"\"\"",
+    "        self.parameters[name] = value",
+    "",
+    "    def get_environment_variable(self, name: str, default=None):",
+    "        \"\"\"Get environment variable value\"\"\"",
+    "        return os.getenv(name, default)",
+    "",
+    "    def set_environment_variable(self, name: str, value: str):",
+    "        \"\"\"Set environment variable value\"\"\"",
+    "        os.environ[name] = value",
+    "",
+    "    def validate_configuration(self):",
+    "        \"\"\"Validate all variables and parameters\"\"\"",
+    "        errors = []",
+    "",
+    "        # Validate required variables",
+    "        for var in self.variables:",
+    "            if var.is_required and not var.value:",
+    "                errors.append(f\"Required variable {var.name} is missing or empty\")",
+    "",
+    "        # Validate required parameters",
+    "        for param in self.parameters:",
+    "            if param.is_required and not param.value:",
+    "                errors.append(f\"Required parameter {param.name} is missing or empty\")",
+    "",
+    "        if errors:",
+    "            raise ValueError(f\"Configuration validation failed: {'; '.join(errors)}\")",
+    "",
+    "        return True",
+    "",
+)
+
+
+@dataclass(slots=True)
 class VariableConfig:
     """Variable configuration"""
     name: str
@@ -48,9 +223,16 @@ class VariableConfig:
     is_required: bool = False
     default_value: Optional[Any] = None
     validation_rules: Optional[str] = None
+    # Cached emission strings, computed once instead of per generator
+    repr_value: str = field(init=False, repr=False)
+    desc_text: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.repr_value = repr(self.value)
+        self.desc_text = self.description or 'No description'
 
 
-@dataclass
+@dataclass(slots=True)
 class ParameterConfig:
     """Parameter configuration"""
     name: str
@@ -61,9 +243,16 @@ class ParameterConfig:
     is_required: bool = False
     default_value: Optional[Any] = None
     validation_rules: Optional[str] = None
+    # Cached emission strings, computed once instead of per generator
+    repr_value: str = field(init=False, repr=False)
+    desc_text: str = field(init=False, repr=False)
 
+    def __post_init__(self):
+        self.repr_value = repr(self.value)
+        self.desc_text = self.description or 'No description'
 
-@dataclass
+
+@dataclass(slots=True)
 class EnvironmentVariable:
     """Environment variable representation"""
     name: str
@@ -72,7 +261,7 @@ class EnvironmentVariable:
     is_secret: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class VariableHandlingResult:
     """Result of variable and parameter handling"""
     variables: List[VariableConfig]
@@ -88,29 +277,35 @@ class VariableHandlingResult:
 
 class VariableHandler(LoggerMixin):
     """Handle SSIS variables and parameters in Python"""
-    
+
+    # Immutable SSIS-to-Python mappings, shared by every handler instance
+    type_mappings = MappingProxyType({
+        'String': VariableType.STRING,
+        'Int32': VariableType.INT,
+        'Int64': VariableType.INT,
+        'Double': VariableType.FLOAT,
+        'Boolean': VariableType.BOOLEAN,
+        'DateTime': VariableType.DATETIME,
+        'Object': VariableType.OBJECT
+    })
+
+    scope_mappings = MappingProxyType({
+        'Package': VariableScope.PACKAGE,
+        'System': VariableScope.SYSTEM,
+        'User': VariableScope.USER,
+        'Environment': VariableScope.ENVIRONMENT
+    })
+
     def __init__(self, error_handler: Optional[ErrorHandler] = None):
         self.error_handler = error_handler or ErrorHandler()
+        # Memoized results keyed by a digest of the inputs; migrations
+        # often hand the same variable lists through several phases
+        self._result_cache: Dict[str, VariableHandlingResult] = {}
         self.logger.info("Variable Handler initialized")
-        
-        # Variable type mappings
-        self.type_mappings = {
-            'String': VariableType.STRING,
-            'Int32': VariableType.INT,
-            'Int64': VariableType.INT,
-            'Double': VariableType.FLOAT,
-            'Boolean': VariableType.BOOLEAN,
-            'DateTime': VariableType.DATETIME,
-            'Object': VariableType.OBJECT
-        }
-        
-        # Scope mappings
-        self.scope_mappings = {
-            'Package': VariableScope.PACKAGE,
-            'System': VariableScope.SYSTEM,
-            'User': VariableScope.USER,
-            'Environment': VariableScope.ENVIRONMENT
-        }
+
+    def clear_cache(self) -> None:
+        """Drop all memoized handling results"""
+        self._result_cache.clear()
     
     def handle_variables_and_parameters(
         self,
@@ -130,58 +325,56 @@ class VariableHandler(LoggerMixin):
             VariableHandlingResult with Python variable handling code
         """
         try:
+            # Same digest recipe as the generator's package fingerprint:
+            # canonical JSON, hashed
+            cache_key = hashlib.sha256(json.dumps(
+                (variables, parameters, environment_variables),
+                sort_keys=True, default=str
+            ).encode('utf-8')).hexdigest()
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self.logger.debug("Reusing cached result for identical variable input")
+                return cached
+
             self.logger.info(f"Handling {len(variables)} variables and {len(parameters or [])} parameters")
-            
-            # Convert variables
-            variable_configs = []
-            for var in variables:
-                try:
-                    var_config = self._convert_variable(var)
-                    variable_configs.append(var_config)
-                except Exception as e:
-                    error = ConversionError(
-                        f"Failed to convert variable {var.get('name', 'Unknown')}: {str(e)}",
-                        severity=ErrorSeverity.MEDIUM,
-                        source_component="VariableHandler"
-                    )
-                    self.error_handler.handle_error(error)
-                    continue
-            
-            # Convert parameters
-            parameter_configs = []
-            if parameters:
-                for param in parameters:
-                    try:
-                        param_config = self._convert_parameter(param)
-                        parameter_configs.append(param_config)
-                    except Exception as e:
-                        error = ConversionError(
-                            f"Failed to convert parameter {param.get('name', 'Unknown')}: {str(e)}",
-                            severity=ErrorSeverity.MEDIUM,
-                            source_component="VariableHandler"
-                        )
-                        self.error_handler.handle_error(error)
-                        continue
-            
-            # Convert environment variables
+
+            # Convert variables, parameters and environment variables;
+            # failures are collected and reported in one batch at the end
+            variable_configs, failures = self._convert_batch(
+                variables, self._convert_variable, "variable"
+            )
+            parameter_configs, param_failures = self._convert_batch(
+                parameters or [], self._convert_parameter, "parameter"
+            )
+            failures.extend(param_failures)
+
             env_vars = []
             if environment_variables:
-                for name, value in environment_variables.items():
-                    try:
-                        env_var = self._convert_environment_variable(name, value)
-                        env_vars.append(env_var)
-                    except Exception as e:
-                        error = ConversionError(
-                            f"Failed to convert environment variable {name}: {str(e)}",
-                            severity=ErrorSeverity.MEDIUM,
-                            source_component="VariableHandler"
-                        )
-                        self.error_handler.handle_error(error)
-                        continue
+                env_vars, env_failures = self._convert_batch(
+                    list(environment_variables.items()),
+                    lambda item: self._convert_environment_variable(*item),
+                    "environment variable"
+                )
+                failures.extend(env_failures)
+
+            self._report_conversion_failures(failures)
             
-            # Generate Python code
-            python_code = self._generate_variable_code(variable_configs, parameter_configs, env_vars)
-            config_code = self._generate_config_code(variable_configs, parameter_configs, env_vars)
+            # Generate Python code; the two data-driven generators are
+            # independent, so large packages overlap them in a pool
+            total_configs = len(variable_configs) + len(parameter_configs) + len(env_vars)
+            if total_configs > _PARALLEL_CODEGEN_THRESHOLD:
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    python_future = pool.submit(
+                        self._generate_variable_code, variable_configs, parameter_configs, env_vars
+                    )
+                    config_future = pool.submit(
+                        self._generate_config_code, variable_configs, parameter_configs, env_vars
+                    )
+                    python_code = python_future.result()
+                    config_code = config_future.result()
+            else:
+                python_code = self._generate_variable_code(variable_configs, parameter_configs, env_vars)
+                config_code = self._generate_config_code(variable_configs, parameter_configs, env_vars)
             validation_code = self._generate_validation_code(variable_configs, parameter_configs)
             
             # Collect imports and dependencies
@@ -205,6 +398,11 @@ class VariableHandler(LoggerMixin):
                 }
             )
             
+            if len(self._result_cache) >= _RESULT_CACHE_LIMIT:
+                # Evict the oldest entry; insertion order is enough here
+                self._result_cache.pop(next(iter(self._result_cache)))
+            self._result_cache[cache_key] = result
+
             self.logger.info("Variable and parameter handling completed successfully")
             return result
             
@@ -223,66 +421,104 @@ class VariableHandler(LoggerMixin):
             )
             raise
     
+    def _convert_batch(self, items, converter, kind):
+        """Convert items, returning (configs, failures)
+
+        Failures are accumulated as (kind, name, exception) tuples so the
+        error objects are only built once per batch instead of inside the
+        hot loop. Very large batches fan out over a thread pool.
+        """
+        if len(items) > _PARALLEL_CONVERT_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 2)) as pool:
+                outcomes = list(pool.map(
+                    lambda item: self._convert_one(item, converter, kind), items
+                ))
+        else:
+            outcomes = [self._convert_one(item, converter, kind) for item in items]
+        configs = [config for config, failure in outcomes if failure is None]
+        failures = [failure for config, failure in outcomes if failure is not None]
+        return configs, failures
+
+    def _convert_one(self, item, converter, kind):
+        """Convert a single item, returning (config, None) or (None, failure)"""
+        try:
+            return converter(item), None
+        except Exception as e:
+            if isinstance(item, dict):
+                name = item.get('name', 'Unknown')
+            elif isinstance(item, tuple):
+                name = item[0]
+            else:
+                name = 'Unknown'
+            return None, (kind, name, e)
+
+    def _report_conversion_failures(self, failures):
+        """Report collected conversion failures through the error handler"""
+        for kind, name, e in failures:
+            error = ConversionError(
+                f"Failed to convert {kind} {name}: {str(e)}",
+                severity=ErrorSeverity.MEDIUM,
+                source_component="VariableHandler"
+            )
+            self.error_handler.handle_error(error)
+
     def _convert_variable(self, variable: Dict[str, Any]) -> VariableConfig:
         """Convert SSIS variable to VariableConfig"""
-        name = variable.get('name', 'Unknown')
-        value = variable.get('value', '')
-        var_type = variable.get('type', 'String')
-        scope = variable.get('scope', 'Package')
-        description = variable.get('description', '')
-        
+        # Fetch all fields in one pass over the key order
+        get = variable.get
+        name, value, var_type, scope, description, read_only, required, \
+            default_value, validation_rules = (get(k) for k in _VAR_KEYS)
+
         # Determine variable type
-        variable_type = self.type_mappings.get(var_type, VariableType.UNKNOWN)
-        
+        variable_type = self.type_mappings.get(var_type or 'String', VariableType.UNKNOWN)
+
         # Determine scope
-        variable_scope = self.scope_mappings.get(scope, VariableScope.UNKNOWN)
-        
+        variable_scope = self.scope_mappings.get(scope or 'Package', VariableScope.UNKNOWN)
+
         # Convert value based on type
         converted_value = self._convert_value(value, variable_type)
-        
+
         return VariableConfig(
-            name=name,
+            # Interned so the same name across many packages shares one
+            # string object and dict lookups hit the pointer-equality path
+            name=sys.intern(str(name)) if name else 'Unknown',
             value=converted_value,
             variable_type=variable_type,
             scope=variable_scope,
-            description=description,
-            is_read_only=variable.get('read_only', False),
-            is_required=variable.get('required', False),
-            default_value=variable.get('default_value'),
-            validation_rules=variable.get('validation_rules')
+            description=description or '',
+            is_read_only=bool(read_only),
+            is_required=bool(required),
+            default_value=default_value,
+            validation_rules=validation_rules
         )
     
     def _convert_parameter(self, parameter: Dict[str, Any]) -> ParameterConfig:
         """Convert SSIS parameter to ParameterConfig"""
-        name = parameter.get('name', 'Unknown')
-        value = parameter.get('value', '')
-        param_type = parameter.get('type', 'String')
-        direction = parameter.get('direction', 'input')
-        description = parameter.get('description', '')
-        
+        get = parameter.get
+        name, value, param_type, direction, description, required, \
+            default_value, validation_rules = (get(k) for k in _PARAM_KEYS)
+
         # Determine parameter type
-        parameter_type = self.type_mappings.get(param_type, VariableType.UNKNOWN)
-        
+        parameter_type = self.type_mappings.get(param_type or 'String', VariableType.UNKNOWN)
+
         # Convert value based on type
         converted_value = self._convert_value(value, parameter_type)
-        
+
         return ParameterConfig(
-            name=name,
+            name=sys.intern(str(name)) if name else 'Unknown',
             value=converted_value,
             parameter_type=parameter_type,
-            direction=direction,
-            description=description,
-            is_required=parameter.get('required', False),
-            default_value=parameter.get('default_value'),
-            validation_rules=parameter.get('validation_rules')
+            direction=direction or 'input',
+            description=description or '',
+            is_required=bool(required),
+            default_value=default_value,
+            validation_rules=validation_rules
         )
     
     def _convert_environment_variable(self, name: str, value: str) -> EnvironmentVariable:
         """Convert environment variable to EnvironmentVariable"""
         # Check if it's a secret (password, key, etc.)
-        is_secret = any(secret_word in name.lower() for secret_word in [
-            'password', 'passwd', 'pwd', 'secret', 'key', 'token', 'auth'
-        ])
+        is_secret = bool(_SECRET_RE.search(name))
         
         return EnvironmentVariable(
             name=name,
@@ -297,22 +533,8 @@ class VariableHandler(LoggerMixin):
             return None
         
         try:
-            if value_type == VariableType.INT:
-                return int(value)
-            elif value_type == VariableType.FLOAT:
-                return float(value)
-            elif value_type == VariableType.BOOLEAN:
-                if isinstance(value, str):
-                    return value.lower() in ['true', '1', 'yes', 'on']
-                return bool(value)
-            elif value_type == VariableType.DATETIME:
-                # Handle datetime conversion
-                from datetime import datetime
-                if isinstance(value, str):
-                    return datetime.fromisoformat(value.replace('Z', '+00:00'))
-                return value
-            else:
-                return str(value)
+            converter = _CONVERTERS.get(value_type)
+            return converter(value) if converter else str(value)
         except (ValueError, TypeError) as e:
             self.logger.warning(f"Failed to convert value {value} to type {value_type}: {str(e)}")
             return str(value)
@@ -324,110 +546,32 @@ class VariableHandler(LoggerMixin):
         environment_variables: List[EnvironmentVariable]
     ) -> str:
         """Generate Python code for variable handling"""
-        code_lines = [
-            "# Variable and Parameter Handling",
-            "",
-            "class VariableManager:",
-            "    \"\"\"Manage SSIS variables and parameters\"\"\"",
-            "",
-            "    def __init__(self):",
-            "        self.variables = {}",
-            "        self.parameters = {}",
-            "        self._load_variables()",
-            "        self._load_parameters()",
-            "        self._load_environment_variables()",
-            "",
-            "    def _load_variables(self):",
-            "        \"\"\"Load variables from configuration\"\"\""
-        ]
-        
-        # Add variable loading code
-        for var in variables:
-            code_lines.extend([
-                f"        # {var.name}: {var.description or 'No description'}",
-                f"        self.variables['{var.name}'] = {repr(var.value)}"
-            ])
-        
-        code_lines.extend([
-            "",
-            "    def _load_parameters(self):",
-            "        \"\"\"Load parameters from configuration\"\"\""
-        ])
-        
-        # Add parameter loading code
-        for param in parameters:
-            code_lines.extend([
-                f"        # {param.name}: {param.description or 'No description'}",
-                f"        self.parameters['{param.name}'] = {repr(param.value)}"
-            ])
-        
-        code_lines.extend([
-            "",
-            "    def _load_environment_variables(self):",
-            "        \"\"\"Load environment variables\"\"\""
-        ])
-        
-        # Add environment variable loading code
-        for env_var in environment_variables:
-            if env_var.is_secret:
-                code_lines.extend([
-                    f"        # {env_var.name}: {env_var.description} (SECRET)",
-                    f"        self.variables['{env_var.name}'] = os.getenv('{env_var.name}', '')"
-                ])
-            else:
-                code_lines.extend([
-                    f"        # {env_var.name}: {env_var.description}",
-                    f"        self.variables['{env_var.name}'] = os.getenv('{env_var.name}', '')"
-                ])
-        
-        code_lines.extend([
-            "",
-            "    def get_variable(self, name: str, default=None):",
-            "        \"\"\"Get variable value\"\"\"",
-            "        return self.variables.get(name, default)",
-            "",
-            "    def set_variable(self, name: str, value: Any):",
-            "        \"\"\"Set variable value\"\"\"",
-            "        self.variables[name] = value",
-            "",
-            "    def get_parameter(self, name: str, default=None):",
-            "        \"\"\"Get parameter value\"\"\"",
-            "        return self.parameters.get(name, default)",
-            "",
-            "    def set_parameter(self, name: str, value: Any):",
-            "        \"\"\"Set parameter value\"\"\"",
-            "        self.parameters[name] = value",
-            "",
-            "    def get_environment_variable(self, name: str, default=None):",
-            "        \"\"\"Get environment variable value\"\"\"",
-            "        return os.getenv(name, default)",
-            "",
-            "    def set_environment_variable(self, name: str, value: str):",
-            "        \"\"\"Set environment variable value\"\"\"",
-            "        os.environ[name] = value",
-            "",
-            "    def validate_configuration(self):",
-            "        \"\"\"Validate all variables and parameters\"\"\"",
-            "        errors = []",
-            "",
-            "        # Validate required variables",
-            "        for var in self.variables:",
-            "            if var.is_required and not var.value:",
-            "                errors.append(f\"Required variable {var.name} is missing or empty\")",
-            "",
-            "        # Validate required parameters",
-            "        for param in self.parameters:",
-            "            if param.is_required and not param.value:",
-            "                errors.append(f\"Required parameter {param.name} is missing or empty\")",
-            "",
-            "        if errors:",
-            "            raise ValueError(f\"Configuration validation failed: {'; '.join(errors)}\")",
-            "",
-            "        return True",
-            ""
-        ])
-        
-        return "\n".join(code_lines)
+        # One generator per section, joined in a single pass
+        variable_lines = chain.from_iterable(
+            (f"        # {var.name}: {var.desc_text}",
+             f"        self.variables['{var.name}'] = {var.repr_value}")
+            for var in variables
+        )
+        parameter_lines = chain.from_iterable(
+            (f"        # {param.name}: {param.desc_text}",
+             f"        self.parameters['{param.name}'] = {param.repr_value}")
+            for param in parameters
+        )
+        env_var_lines = chain.from_iterable(
+            (f"        # {env_var.name}: {env_var.description}" + (" (SECRET)" if env_var.is_secret else ""),
+             f"        self.variables['{env_var.name}'] = os.getenv('{env_var.name}', '')")
+            for env_var in environment_variables
+        )
+
+        return "\n".join(chain(
+            _VARIABLE_CODE_HEADER,
+            variable_lines,
+            _PARAMETER_SECTION_HEADER,
+            parameter_lines,
+            _ENV_VAR_SECTION_HEADER,
+            env_var_lines,
+            _VARIABLE_CODE_FOOTER
+        ))
     
     def _generate_config_code(
         self,
@@ -436,42 +580,45 @@ class VariableHandler(LoggerMixin):
         environment_variables: List[EnvironmentVariable]
     ) -> str:
         """Generate configuration code"""
-        code_lines = [
-            "# Configuration for variables and parameters",
-            "",
-            "# Variables",
-            "VARIABLES = {"
-        ]
-        
-        for var in variables:
-            code_lines.append(f"    '{var.name}': {repr(var.value)},  # {var.description or 'No description'}")
-        
-        code_lines.extend([
-            "}",
-            "",
-            "# Parameters",
-            "PARAMETERS = {"
-        ])
-        
-        for param in parameters:
-            code_lines.append(f"    '{param.name}': {repr(param.value)},  # {param.description or 'No description'}")
-        
-        code_lines.extend([
-            "}",
-            "",
-            "# Environment Variables",
-            "ENVIRONMENT_VARIABLES = {"
-        ])
-        
-        for env_var in environment_variables:
-            if env_var.is_secret:
-                code_lines.append(f"    '{env_var.name}': '***SECRET***',  # {env_var.description}")
-            else:
-                code_lines.append(f"    '{env_var.name}': '{env_var.value}',  # {env_var.description}")
-        
-        code_lines.append("}")
-        
-        return "\n".join(code_lines)
+        variable_lines = (
+            f"    '{var.name}': {var.repr_value},  # {var.desc_text}"
+            for var in variables
+        )
+        parameter_lines = (
+            f"    '{param.name}': {param.repr_value},  # {param.desc_text}"
+            for param in parameters
+        )
+        env_var_lines = (
+            f"    '{env_var.name}': '***SECRET***',  # {env_var.description}"
+            if env_var.is_secret else
+            f"    '{env_var.name}': '{env_var.value}',  # {env_var.description}"
+            for env_var in environment_variables
+        )
+
+        return "\n".join(chain(
+            (
+                "# Configuration for variables and parameters",
+                "",
+                "# Variables",
+                "VARIABLES = {"
+            ),
+            variable_lines,
+            (
+                "}",
+                "",
+                "# Parameters",
+                "PARAMETERS = {"
+            ),
+            parameter_lines,
+            (
+                "}",
+                "",
+                "# Environment Variables",
+                "ENVIRONMENT_VARIABLES = {"
+            ),
+            env_var_lines,
+            ("}",)
+        ))
     
     def _generate_validation_code(
         self,
@@ -479,64 +626,15 @@ class VariableHandler(LoggerMixin):
         parameters: List[ParameterConfig]
     ) -> str:
         """Generate validation code"""
-        code_lines = [
-            "# Validation functions",
-            "",
-            "def validate_variable_type(value: Any, expected_type: str) -> bool:",
-            "    \"\"\"Validate variable type\"\"\"",
-            "    try:",
-            "        if expected_type == 'int':",
-            "            int(value)",
-            "        elif expected_type == 'float':",
-            "            float(value)",
-            "        elif expected_type == 'boolean':",
-            "            if isinstance(value, str):",
-            "                return value.lower() in ['true', 'false', '1', '0', 'yes', 'no']",
-            "            return isinstance(value, bool)",
-            "        elif expected_type == 'datetime':",
-            "            from datetime import datetime",
-            "            if isinstance(value, str):",
-            "                datetime.fromisoformat(value.replace('Z', '+00:00'))",
-            "        return True",
-            "    except (ValueError, TypeError):",
-            "        return False",
-            "",
-            "def validate_required_variables(variables: dict, required_vars: list) -> list:",
-            "    \"\"\"Validate required variables\"\"\"",
-            "    missing = []",
-            "    for var_name in required_vars:",
-            "        if var_name not in variables or not variables[var_name]:",
-            "            missing.append(var_name)",
-            "    return missing",
-            "",
-            "def validate_parameter_substitution(text: str, parameters: dict) -> str:",
-            "    \"\"\"Validate and perform parameter substitution\"\"\"",
-            "    import re",
-            "",
-            "    # Pattern for parameter substitution: $(ParameterName) or @[User::VariableName]",
-            "    param_pattern = r'\\$\\(([^)]+)\\)|@\\[User::([^\\]]+)\\]'",
-            "",
-            "    def replace_param(match):",
-            "        param_name = match.group(1) or match.group(2)",
-            "        if param_name in parameters:",
-            "            return str(parameters[param_name])",
-            "        else:",
-            "            raise ValueError(f\"Parameter {param_name} not found\")",
-            "",
-            "    return re.sub(param_pattern, replace_param, text)",
-            ""
-        ]
-        
-        return "\n".join(code_lines)
+        # The validation helpers are static; the text is built once at
+        # import time
+        return _VALIDATION_CODE
     
     def substitute_parameters(self, text: str, parameters: Dict[str, Any]) -> str:
         """Substitute parameters in text"""
         if not text or not parameters:
             return text
-        
-        # Pattern for parameter substitution: $(ParameterName) or @[User::VariableName]
-        param_pattern = r'\$\(([^)]+)\)|@\[User::([^\]]+)\]'
-        
+
         def replace_param(match):
             param_name = match.group(1) or match.group(2)
             if param_name in parameters:
@@ -544,8 +642,8 @@ class VariableHandler(LoggerMixin):
             else:
                 self.logger.warning(f"Parameter {param_name} not found for substitution")
                 return match.group(0)  # Keep original if not found
-        
-        return re.sub(param_pattern, replace_param, text)
+
+        return _PARAM_PATTERN.sub(replace_param, text)
     
     def validate_configuration(
         self,
@@ -554,41 +652,26 @@ class VariableHandler(LoggerMixin):
     ) -> List[str]:
         """Validate configuration and return list of errors"""
         errors = []
-        
-        # Validate required variables
+
+        # Required-ness and type checks run in a single pass per list
         for var in variables:
             if var.is_required and (var.value is None or var.value == ''):
                 errors.append(f"Required variable {var.name} is missing or empty")
-        
-        # Validate required parameters
-        for param in parameters:
-            if param.is_required and (param.value is None or param.value == ''):
-                errors.append(f"Required parameter {param.name} is missing or empty")
-        
-        # Validate variable types
-        for var in variables:
             if var.value is not None and var.validation_rules:
                 # Basic type validation
                 if not self._validate_value_type(var.value, var.variable_type):
                     errors.append(f"Variable {var.name} has invalid type for {var.variable_type.value}")
-        
+
+        for param in parameters:
+            if param.is_required and (param.value is None or param.value == ''):
+                errors.append(f"Required parameter {param.name} is missing or empty")
+
         return errors
     
     def _validate_value_type(self, value: Any, value_type: VariableType) -> bool:
         """Validate value type"""
         try:
-            if value_type == VariableType.INT:
-                int(value)
-            elif value_type == VariableType.FLOAT:
-                float(value)
-            elif value_type == VariableType.BOOLEAN:
-                if isinstance(value, str):
-                    return value.lower() in ['true', 'false', '1', '0', 'yes', 'no']
-                return isinstance(value, bool)
-            elif value_type == VariableType.DATETIME:
-                from datetime import datetime
-                if isinstance(value, str):
-                    datetime.fromisoformat(value.replace('Z', '+00:00'))
-            return True
+            checker = _VALIDATORS.get(value_type)
+            return checker(value) if checker else True
         except (ValueError, TypeError):
             return False 
\ No newline at end of file
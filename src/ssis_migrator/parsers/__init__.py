@@ -3,16 +3,32 @@
 SSIS Parsers Module
 
 This module contains parsers for SSIS packages and related files.
+Submodules are imported lazily (PEP 562) so importing the package does
+not pay for parsers that a given run never uses.
 """
 
-from .dtsx_parser import DTSXParser
-from .component_parser import ComponentParser
-from .connection_parser import ConnectionParser
-from .variable_parser import VariableParser
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY = {
+    'DTSXParser': '.dtsx_parser',
+    'ComponentParser': '.component_parser',
+    'ConnectionParser': '.connection_parser',
+    'VariableParser': '.variable_parser',
+}
 
 __all__ = [
     'DTSXParser',
-    'ComponentParser', 
+    'ComponentParser',
     'ConnectionParser',
     'VariableParser'
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,42 +3,164 @@
 Component Parser - Parse SSIS data flow components
 """
 
-import xml.etree.ElementTree as ET
+from lxml import etree as ET
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 from ..core.logger import LoggerMixin
 
+# Below this many components the thread-pool overhead outweighs the win
+_PARALLEL_PARSE_THRESHOLD = 100
+
+# Component class IDs to friendly type names, shared by every parser
+# instance
+_COMPONENT_TYPES = {
+    # Sources
+    '{E9216C7C-4A8A-4F77-8948-60C5D8C75F70}': 'OLE DB Source',
+    '{A560E93D-4177-4C8B-9F5F-96F8FD959C4B}': 'Flat File Source',
+    '{C27664E8-786E-4EB0-9A94-D2CCF1AFE4EE}': 'Excel Source',
+    '{C8C8C883-0E37-4C98-A094-E4B6BB9E42B5}': 'XML Source',
+
+    # Destinations
+    '{E9216C7C-4A8A-4F77-8948-60C5D8C75F71}': 'OLE DB Destination',
+    '{A560E93D-4177-4C8B-9F5F-96F8FD959C4C}': 'Flat File Destination',
+    '{C27664E8-786E-4EB0-9A94-D2CCF1AFE4EF}': 'Excel Destination',
+
+    # Transformations
+    '{C9C7375C-8340-4F56-A550-919B1E4F4C66}': 'Derived Column',
+    '{149447B8-8A7C-4FC7-B4E6-5DD2687916C1}': 'Data Conversion',
+    '{1E7B0B8A-8A7C-4FC7-B4E6-5DD2687916C1}': 'Lookup',
+    '{2E7B0B8A-8A7C-4FC7-B4E6-5DD2687916C1}': 'Merge Join',
+    '{3E7B0B8A-8A7C-4FC7-B4E6-5DD2687916C1}': 'Union All',
+    '{4E7B0B8A-8A7C-4FC7-B4E6-5DD2687916C1}': 'Sort',
+    '{5E7B0B8A-8A7C-4FC7-B4E6-5DD2687916C1}': 'Aggregate',
+    '{6E7B0B8A-8A7C-4FC7-B4E6-5DD2687916C1}': 'Conditional Split',
+    '{7E7B0B8A-8A7C-4FC7-B4E6-5DD2687916C1}': 'Multicast',
+    '{8E7B0B8A-8A7C-4FC7-B4E6-5DD2687916C1}': 'Script Component'
+}
+
+# Type-category membership sets; frozenset keeps the checks O(1) and
+# allocation-free in per-component loops
+_SOURCE_TYPES = frozenset((
+    'OLE DB Source', 'Flat File Source', 'Excel Source', 'XML Source'
+))
+_DEST_TYPES = frozenset((
+    'OLE DB Destination', 'Flat File Destination', 'Excel Destination'
+))
+_TRANSFORM_TYPES = frozenset((
+    'Derived Column', 'Data Conversion', 'Lookup', 'Merge Join',
+    'Union All', 'Sort', 'Aggregate', 'Conditional Split',
+    'Multicast', 'Script Component'
+))
+
+# Truthy attribute spellings; membership beats lowercasing every value
+_TRUTHY = frozenset(('true', 'True', 'TRUE', '1', 'yes', 'Yes', 'YES'))
+
+# Column attribute name to (result key, converter); lets _parse_column
+# read every attribute in one pass over attrib instead of nine get calls
+_COL_ATTR_MAP = {
+    'pipeline:name': ('name', None),
+    'pipeline:description': ('description', None),
+    'pipeline:lineageId': ('lineage_id', None),
+    'pipeline:dataType': ('data_type', None),
+    'pipeline:precision': ('precision', int),
+    'pipeline:scale': ('scale', int),
+    'pipeline:length': ('length', int),
+    'pipeline:externalMetadataColumnName': ('external_metadata_column_name', None),
+    'pipeline:expression': ('expression', None),
+}
+
+# Child paths walked for every component; compiled once per namespace
+_PIPELINE_PATHS = (
+    'pipeline:properties/pipeline:property',
+    'pipeline:inputs/pipeline:input',
+    'pipeline:outputs/pipeline:output',
+    'pipeline:inputColumns/pipeline:inputColumn',
+    'pipeline:outputColumns/pipeline:outputColumn',
+)
+
+
+@lru_cache(maxsize=8)
+def _compiled_xpaths(pipeline_ns: str) -> Dict[str, ET.XPath]:
+    """Compile the recurring pipeline queries once per namespace URI"""
+    ns = {'pipeline': pipeline_ns}
+    return {p: ET.XPath(p, namespaces=ns) for p in _PIPELINE_PATHS}
+
+
+def _query(elem, namespaces: Dict[str, str], path: str) -> List:
+    """Run a precompiled XPath, falling back to findall for elements
+    that did not come from lxml (the dtsx parser still produces stdlib
+    ElementTree nodes)."""
+    if isinstance(elem, ET._Element):
+        return _compiled_xpaths(namespaces['pipeline'])[path](elem)
+    return elem.findall(path, namespaces)
+
+
+def _safe_int(value: str, default: int = 0) -> int:
+    """Parse an integer attribute, defaulting instead of raising
+
+    Malformed values (empty, None, junk) used to raise out of the
+    column loop and silently drop the whole column. No pre-check: any
+    guard cheaper than int() itself accepts strings int() rejects
+    ('--5', non-ASCII digits) and rejects ones it accepts (' 5').
+    """
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _build_column_extractor():
+    """Generate a straight-line column extractor from _COL_ATTR_MAP
+
+    The attribute set is fixed, so instead of looping over attrib and
+    dispatching per name we compile one function of unrolled get calls
+    (the approach serialization libraries use for fixed schemas): no
+    loop, no per-attribute dict lookup, one dict display allocation.
+    """
+    lines = [
+        'def _extract_column(col_elem, _safe_int=_safe_int, _intern=sys.intern):',
+        '    g = col_elem.get',
+        '    return {',
+    ]
+    for attr_name, (key, converter) in _COL_ATTR_MAP.items():
+        if converter is int:
+            lines.append(f'        {key!r}: _safe_int(g({attr_name!r})),')
+        elif key == 'data_type':
+            # Type names draw from a tiny vocabulary repeated across
+            # every column; intern them down to one object each
+            lines.append(f'        {key!r}: _intern(g({attr_name!r}, \'\')),')
+        else:
+            lines.append(f'        {key!r}: g({attr_name!r}, \'\'),')
+    lines.append('    }')
+    namespace = {'_safe_int': _safe_int, 'sys': sys}
+    exec('\n'.join(lines), namespace)
+    return namespace['_extract_column']
+
+
+_extract_column = _build_column_extractor()
+
+
+def _validate_component_attrs(comp_elem) -> bool:
+    """Cheap structural check before parsing a component element
+
+    Filters out comments/processing instructions (non-string tags) and
+    anything without an attribute interface, so the parse path itself
+    can run without defensive try/except at every level.
+    """
+    return isinstance(getattr(comp_elem, 'tag', None), str) and hasattr(comp_elem, 'get')
+
 
 class ComponentParser(LoggerMixin):
     """Parser for SSIS data flow components"""
-    
+
+    # Component type mappings
+    component_types = _COMPONENT_TYPES
+
     def __init__(self):
         self.logger.info("Component Parser initialized")
-        
-        # Component type mappings
-        self.component_types = {
-            # Sources
-            '{E9216C7C-4A8A-4F77-8948-60C5D8C75F70}': 'OLE DB Source',
-            '{A560E93D-4177-4C8B-9F5F-96F8FD959C4B}': 'Flat File Source',
-            '{C27664E8-786E-4EB0-9A94-D2CCF1AFE4EE}': 'Excel Source',
-            '{C8C8C883-0E37-4C98-A094-E4B6BB9E42B5}': 'XML Source',
-            
-            # Destinations
-            '{E9216C7C-4A8A-4F77-8948-60C5D8C75F71}': 'OLE DB Destination',
-            '{A560E93D-4177-4C8B-9F5F-96F8FD959C4C}': 'Flat File Destination',
-            '{C27664E8-786E-4EB0-9A94-D2CCF1AFE4EF}': 'Excel Destination',
-            
-            # Transformations
-            '{C9C7375C-8340-4F56-A550-919B1E4F4C66}': 'Derived Column',
-            '{149447B8-8A7C-4FC7-B4E6-5DD2687916C1}': 'Data Conversion',
-            '{1E7B0B8A-8A7C-4FC7-B4E6-5DD2687916C1}': 'Lookup',
-            '{2E7B0B8A-8A7C-4FC7-B4E6-5DD2687916C1}': 'Merge Join',
-            '{3E7B0B8A-8A7C-4FC7-B4E6-5DD2687916C1}': 'Union All',
-            '{4E7B0B8A-8A7C-4FC7-B4E6-5DD2687916C1}': 'Sort',
-            '{5E7B0B8A-8A7C-4FC7-B4E6-5DD2687916C1}': 'Aggregate',
-            '{6E7B0B8A-8A7C-4FC7-B4E6-5DD2687916C1}': 'Conditional Split',
-            '{7E7B0B8A-8A7C-4FC7-B4E6-5DD2687916C1}': 'Multicast',
-            '{8E7B0B8A-8A7C-4FC7-B4E6-5DD2687916C1}': 'Script Component'
-        }
     
     def parse_data_flow_component(self, comp_elem: ET.Element, namespaces: Dict[str, str]) -> Optional[Dict[str, Any]]:
         """
@@ -51,102 +173,128 @@ class ComponentParser(LoggerMixin):
         Returns:
             Dictionary with component information
         """
-        try:
-            # Get component attributes with proper namespace handling
-            def get_attr(element, attr_name):
-                # Try with namespace first
-                ns_attr = f'{{{namespaces["pipeline"]}}}{attr_name}'
-                value = element.get(ns_attr)
-                if value is not None:
-                    return value
-                # Try without namespace
-                return element.get(attr_name, '')
-            
-            component_id = get_attr(comp_elem, 'componentClassID')
-            component_name = get_attr(comp_elem, 'name')
-            component_desc = get_attr(comp_elem, 'description')
-            
-            # Determine component type
-            component_type = self.component_types.get(component_id, 'Unknown')
-            
-            # If component type is still Unknown or if we have a description that might be more specific,
-            # try to determine from description
-            if component_desc:
-                if 'Source' in component_desc:
-                    if 'OLE DB' in component_desc:
-                        component_type = 'OLE DB Source'
-                    elif 'Flat File' in component_desc:
-                        component_type = 'Flat File Source'
-                    elif 'Excel' in component_desc:
-                        component_type = 'Excel Source'
-                    elif 'XML' in component_desc:
-                        component_type = 'XML Source'
-                elif 'Destination' in component_desc:
-                    if 'OLE DB' in component_desc:
-                        component_type = 'OLE DB Destination'
-                    elif 'Flat File' in component_desc:
-                        component_type = 'Flat File Destination'
-                    elif 'Excel' in component_desc:
-                        component_type = 'Excel Destination'
-                elif 'Derived Column' in component_desc:
-                    component_type = 'Derived Column'
-                elif 'Data Conversion' in component_desc:
-                    component_type = 'Data Conversion'
-                elif 'Lookup' in component_desc:
-                    component_type = 'Lookup'
-                elif 'Merge Join' in component_desc:
-                    component_type = 'Merge Join'
-                elif 'Union All' in component_desc:
-                    component_type = 'Union All'
-                elif 'Sort' in component_desc:
-                    component_type = 'Sort'
-                elif 'Aggregate' in component_desc:
-                    component_type = 'Aggregate'
-                elif 'Conditional Split' in component_desc:
-                    component_type = 'Conditional Split'
-                elif 'Multicast' in component_desc:
-                    component_type = 'Multicast'
-                elif 'Script Component' in component_desc:
-                    component_type = 'Script Component'
-            
-            # Parse properties
-            properties = self._parse_component_properties(comp_elem, namespaces)
-            
-            # Parse inputs and outputs
-            inputs = self._parse_component_inputs(comp_elem, namespaces)
-            outputs = self._parse_component_outputs(comp_elem, namespaces)
-            
-            component_info = {
-                'id': component_id,
-                'name': component_name,
-                'description': component_desc,
-                'type': component_type,
-                'properties': properties,
-                'inputs': inputs,
-                'outputs': outputs,
-                'metadata': {
-                    'version': get_attr(comp_elem, 'version'),
-                    'creation_name': get_attr(comp_elem, 'creationName')
-                }
-            }
-            
-            return component_info
-            
-        except Exception as e:
-            self.logger.error(f"Error parsing component {comp_elem.get('name', 'Unknown')}: {str(e)}")
+        if not _validate_component_attrs(comp_elem):
             return None
+
+        # Get component attributes with proper namespace handling
+        def get_attr(element, attr_name):
+            # Try with namespace first
+            ns_attr = f'{{{namespaces["pipeline"]}}}{attr_name}'
+            value = element.get(ns_attr)
+            if value is not None:
+                return value
+            # Try without namespace
+            return element.get(attr_name, '')
+        
+        # Class IDs repeat across every component of the same kind;
+        # interning collapses them to one string object each
+        component_id = sys.intern(get_attr(comp_elem, 'componentClassID'))
+        component_name = get_attr(comp_elem, 'name')
+        component_desc = get_attr(comp_elem, 'description')
+        
+        # Determine component type
+        component_type = self.component_types.get(component_id, 'Unknown')
+        
+        # If component type is still Unknown or if we have a description that might be more specific,
+        # try to determine from description
+        if component_desc:
+            if 'Source' in component_desc:
+                if 'OLE DB' in component_desc:
+                    component_type = 'OLE DB Source'
+                elif 'Flat File' in component_desc:
+                    component_type = 'Flat File Source'
+                elif 'Excel' in component_desc:
+                    component_type = 'Excel Source'
+                elif 'XML' in component_desc:
+                    component_type = 'XML Source'
+            elif 'Destination' in component_desc:
+                if 'OLE DB' in component_desc:
+                    component_type = 'OLE DB Destination'
+                elif 'Flat File' in component_desc:
+                    component_type = 'Flat File Destination'
+                elif 'Excel' in component_desc:
+                    component_type = 'Excel Destination'
+            elif 'Derived Column' in component_desc:
+                component_type = 'Derived Column'
+            elif 'Data Conversion' in component_desc:
+                component_type = 'Data Conversion'
+            elif 'Lookup' in component_desc:
+                component_type = 'Lookup'
+            elif 'Merge Join' in component_desc:
+                component_type = 'Merge Join'
+            elif 'Union All' in component_desc:
+                component_type = 'Union All'
+            elif 'Sort' in component_desc:
+                component_type = 'Sort'
+            elif 'Aggregate' in component_desc:
+                component_type = 'Aggregate'
+            elif 'Conditional Split' in component_desc:
+                component_type = 'Conditional Split'
+            elif 'Multicast' in component_desc:
+                component_type = 'Multicast'
+            elif 'Script Component' in component_desc:
+                component_type = 'Script Component'
+        
+        # Parse properties
+        properties = self._parse_component_properties(comp_elem, namespaces)
+        
+        # Parse inputs and outputs
+        inputs = self._parse_component_inputs(comp_elem, namespaces)
+        outputs = self._parse_component_outputs(comp_elem, namespaces)
+        
+        component_info = {
+            'id': component_id,
+            'name': component_name,
+            'description': component_desc,
+            'type': component_type,
+            'properties': properties,
+            'inputs': inputs,
+            'outputs': outputs,
+            'metadata': {
+                'version': get_attr(comp_elem, 'version'),
+                'creation_name': get_attr(comp_elem, 'creationName')
+            }
+        }
+        
+        return component_info
     
+    def parse_components(self, comp_elems: List[ET.Element], namespaces: Dict[str, str]) -> List[Dict[str, Any]]:
+        """
+        Parse a batch of data flow component elements
+
+        Args:
+            comp_elems: XML elements representing the components
+            namespaces: XML namespaces dictionary
+
+        Returns:
+            List of component information dictionaries (failed components
+            are omitted)
+        """
+        # Errors are caught here, once per component, rather than with
+        # try/except frames in every leaf of the parse path
+        def parse_one(elem):
+            try:
+                return self.parse_data_flow_component(elem, namespaces)
+            except Exception as e:
+                self.logger.error(f"Error parsing component {elem.get('name', 'Unknown')}: {str(e)}")
+                return None
+
+        # Components are independent, so large batches fan out across a
+        # thread pool; lxml releases the GIL while evaluating XPath
+        if len(comp_elems) > _PARALLEL_PARSE_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                return [info for info in pool.map(parse_one, comp_elems) if info]
+        return [info for info in map(parse_one, comp_elems) if info]
+
     def _parse_component_properties(self, comp_elem: ET.Element, namespaces: Dict[str, str]) -> Dict[str, Any]:
         """Parse component properties"""
         properties = {}
         
-        props_elem = comp_elem.find('pipeline:properties', namespaces)
-        if props_elem is not None:
-            for prop_elem in props_elem.findall('pipeline:property', namespaces):
-                prop_name = prop_elem.get('pipeline:name', '')
-                prop_value = prop_elem.get('pipeline:value', '')
-                if prop_name:
-                    properties[prop_name] = prop_value
+        for prop_elem in _query(comp_elem, namespaces, 'pipeline:properties/pipeline:property'):
+            prop_name = prop_elem.get('pipeline:name', '')
+            prop_value = prop_elem.get('pipeline:value', '')
+            if prop_name:
+                properties[prop_name] = prop_value
         
         return properties
     
@@ -154,12 +302,10 @@ class ComponentParser(LoggerMixin):
         """Parse component inputs"""
         inputs = []
         
-        inputs_elem = comp_elem.find('pipeline:inputs', namespaces)
-        if inputs_elem is not None:
-            for input_elem in inputs_elem.findall('pipeline:input', namespaces):
-                input_info = self._parse_input_output(input_elem, namespaces, 'input')
-                if input_info:
-                    inputs.append(input_info)
+        for input_elem in _query(comp_elem, namespaces, 'pipeline:inputs/pipeline:input'):
+            input_info = self._parse_input_output(input_elem, namespaces, 'input')
+            if input_info:
+                inputs.append(input_info)
         
         return inputs
     
@@ -167,62 +313,37 @@ class ComponentParser(LoggerMixin):
         """Parse component outputs"""
         outputs = []
         
-        outputs_elem = comp_elem.find('pipeline:outputs', namespaces)
-        if outputs_elem is not None:
-            for output_elem in outputs_elem.findall('pipeline:output', namespaces):
-                output_info = self._parse_input_output(output_elem, namespaces, 'output')
-                if output_info:
-                    outputs.append(output_info)
+        for output_elem in _query(comp_elem, namespaces, 'pipeline:outputs/pipeline:output'):
+            output_info = self._parse_input_output(output_elem, namespaces, 'output')
+            if output_info:
+                outputs.append(output_info)
         
         return outputs
     
     def _parse_input_output(self, io_elem: ET.Element, namespaces: Dict[str, str], io_type: str) -> Optional[Dict[str, Any]]:
         """Parse input or output element"""
-        try:
-            io_info = {
-                'name': io_elem.get(f'pipeline:{io_type.capitalize()}Name', 'Unknown'),
-                'description': io_elem.get('pipeline:description', ''),
-                'id': io_elem.get('pipeline:id', ''),
-                'is_error_out': io_elem.get('pipeline:isErrorOut', 'False').lower() == 'true',
-                'is_sorted': io_elem.get('pipeline:isSorted', 'False').lower() == 'true',
-                'synchronous': io_elem.get('pipeline:synchronous', 'True').lower() == 'true',
-                'columns': []
-            }
-            
-            # Parse columns
-            columns_elem = io_elem.find(f'pipeline:{io_type}Columns', namespaces)
-            if columns_elem is not None:
-                for col_elem in columns_elem.findall(f'pipeline:{io_type}Column', namespaces):
-                    col_info = self._parse_column(col_elem, namespaces)
-                    if col_info:
-                        io_info['columns'].append(col_info)
-            
-            return io_info
-            
-        except Exception as e:
-            self.logger.error(f"Error parsing {io_type}: {str(e)}")
-            return None
+        io_info = {
+            'name': io_elem.get(f'pipeline:{io_type.capitalize()}Name', 'Unknown'),
+            'description': io_elem.get('pipeline:description', ''),
+            'id': io_elem.get('pipeline:id', ''),
+            'is_error_out': io_elem.get('pipeline:isErrorOut', 'False') in _TRUTHY,
+            'is_sorted': io_elem.get('pipeline:isSorted', 'False') in _TRUTHY,
+            'synchronous': io_elem.get('pipeline:synchronous', 'True') in _TRUTHY,
+            'columns': []
+        }
+
+        # Parse columns
+        col_path = f'pipeline:{io_type}Columns/pipeline:{io_type}Column'
+        for col_elem in _query(io_elem, namespaces, col_path):
+            col_info = self._parse_column(col_elem, namespaces)
+            if col_info:
+                io_info['columns'].append(col_info)
+
+        return io_info
     
     def _parse_column(self, col_elem: ET.Element, namespaces: Dict[str, str]) -> Optional[Dict[str, Any]]:
         """Parse column information"""
-        try:
-            col_info = {
-                'name': col_elem.get('pipeline:name', ''),
-                'description': col_elem.get('pipeline:description', ''),
-                'lineage_id': col_elem.get('pipeline:lineageId', ''),
-                'data_type': col_elem.get('pipeline:dataType', ''),
-                'precision': int(col_elem.get('pipeline:precision', '0')),
-                'scale': int(col_elem.get('pipeline:scale', '0')),
-                'length': int(col_elem.get('pipeline:length', '0')),
-                'external_metadata_column_name': col_elem.get('pipeline:externalMetadataColumnName', ''),
-                'expression': col_elem.get('pipeline:expression', '')
-            }
-            
-            return col_info
-            
-        except Exception as e:
-            self.logger.error(f"Error parsing column: {str(e)}")
-            return None
+        return _extract_column(col_elem)
     
     def get_component_type_name(self, component_id: str) -> str:
         """Get human-readable component type name from component ID"""
@@ -230,19 +351,12 @@ class ComponentParser(LoggerMixin):
     
     def is_source_component(self, component_type: str) -> bool:
         """Check if component is a source"""
-        source_types = ['OLE DB Source', 'Flat File Source', 'Excel Source', 'XML Source']
-        return component_type in source_types
+        return component_type in _SOURCE_TYPES
     
     def is_destination_component(self, component_type: str) -> bool:
         """Check if component is a destination"""
-        dest_types = ['OLE DB Destination', 'Flat File Destination', 'Excel Destination']
-        return component_type in dest_types
+        return component_type in _DEST_TYPES
     
     def is_transformation_component(self, component_type: str) -> bool:
         """Check if component is a transformation"""
-        transform_types = [
-            'Derived Column', 'Data Conversion', 'Lookup', 'Merge Join',
-            'Union All', 'Sort', 'Aggregate', 'Conditional Split',
-            'Multicast', 'Script Component'
-        ]
-        return component_type in transform_types 
\ No newline at end of file
+        return component_type in _TRANSFORM_TYPES 
\ No newline at end of file
@@ -3,30 +3,94 @@
 Connection Parser - Parse SSIS connection managers
 """
 
-import xml.etree.ElementTree as ET
+from lxml import etree as ET
+import sys
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 from ..core.logger import LoggerMixin
 
 
+@lru_cache(maxsize=8)
+def _compiled_xpaths(dts_ns: str) -> Dict[str, ET.XPath]:
+    """Compile the recurring DTS queries once per namespace URI"""
+    ns = {'DTS': dts_ns}
+    # The ObjectData/ConnectionManager unions match the namespaced and
+    # plain spellings in one traversal, so the callers' unnamespaced
+    # find fallbacks only run for non-lxml elements
+    return {
+        './/DTS:Property': ET.XPath('.//DTS:Property', namespaces=ns),
+        'DTS:ObjectData': ET.XPath('DTS:ObjectData|ObjectData', namespaces=ns),
+        'DTS:ConnectionManager': ET.XPath('DTS:ConnectionManager|ConnectionManager', namespaces=ns),
+        'DTS:Property': ET.XPath('DTS:Property', namespaces=ns),
+    }
+
+
+@lru_cache(maxsize=256)
+def _clark_name(ns: str, attr_name: str) -> str:
+    """Clark-notation attribute key, formatted once per (ns, name) pair"""
+    return f'{{{ns}}}{attr_name}'
+
+
+def _query(elem, namespaces: Dict[str, str], path: str) -> List:
+    """Run a precompiled XPath, falling back to findall for elements
+    that did not come from lxml (the dtsx parser still produces stdlib
+    ElementTree nodes)."""
+    if isinstance(elem, ET._Element):
+        return _compiled_xpaths(namespaces['DTS'])[path](elem)
+    return elem.findall(path, namespaces)
+
+# Truthy attribute spellings; membership beats lowercasing every value
+_TRUTHY = frozenset(('true', 'True', 'TRUE', '1', 'yes', 'Yes', 'YES'))
+
+# Creation-name suffixes to friendly type names, shared by every parser
+# instance
+_CONNECTION_TYPES = {
+    'OLEDB': 'OLE DB Connection',
+    'FLATFILE': 'Flat File Connection',
+    'EXCEL': 'Excel Connection',
+    'FTP': 'FTP Connection',
+    'HTTP': 'HTTP Connection',
+    'SMTP': 'SMTP Connection',
+    'WMI': 'WMI Connection',
+    'MSMQ': 'MSMQ Connection',
+    'FILE': 'File Connection',
+    'CACHE': 'Cache Connection'
+}
+
+# Category membership sets; frozenset keeps the checks O(1) and
+# allocation-free in per-connection loops
+_DB_TYPES = frozenset((
+    'OLE DB Connection', 'ADO.NET Connection', 'ODBC Connection'
+))
+_FILE_TYPES = frozenset((
+    'Flat File Connection', 'Excel Connection', 'File Connection'
+))
+_WEB_TYPES = frozenset((
+    'HTTP Connection', 'FTP Connection', 'SMTP Connection'
+))
+
+
+@lru_cache(maxsize=128)
+def _conn_type_from_creation(creation_name: str) -> str:
+    """Resolve a creation name like 'Microsoft.OLEDB' to a friendly type
+
+    Packages repeat the same handful of creation names, so the split and
+    lookup run once per distinct name.
+    """
+    if '.' in creation_name:
+        type_part = creation_name.rsplit('.', 1)[-1]
+        return sys.intern(_CONNECTION_TYPES.get(type_part, type_part))
+    return sys.intern(creation_name)
+
+
 class ConnectionParser(LoggerMixin):
     """Parser for SSIS connection managers"""
-    
+
+    # Connection manager type mappings
+    connection_types = _CONNECTION_TYPES
+
     def __init__(self):
         self.logger.info("Connection Parser initialized")
-        
-        # Connection manager type mappings
-        self.connection_types = {
-            'OLEDB': 'OLE DB Connection',
-            'FLATFILE': 'Flat File Connection',
-            'EXCEL': 'Excel Connection',
-            'FTP': 'FTP Connection',
-            'HTTP': 'HTTP Connection',
-            'SMTP': 'SMTP Connection',
-            'WMI': 'WMI Connection',
-            'MSMQ': 'MSMQ Connection',
-            'FILE': 'File Connection',
-            'CACHE': 'Cache Connection'
-        }
     
     def parse_connection_manager(self, conn_elem: ET.Element, namespaces: Dict[str, str]) -> Optional[Dict[str, Any]]:
         """
@@ -42,7 +106,9 @@ class ConnectionParser(LoggerMixin):
         try:
             conn_id = self._get_attr(conn_elem, 'DTSID', namespaces)
             conn_name = self._get_attr(conn_elem, 'ObjectName', namespaces)
-            creation_name = self._get_attr(conn_elem, 'CreationName', namespaces)
+            # Creation names repeat across connection managers of the
+            # same kind; interning collapses them to one object each
+            creation_name = sys.intern(self._get_attr(conn_elem, 'CreationName', namespaces))
             
             # Determine connection type
             conn_type = self._get_connection_type(creation_name)
@@ -64,7 +130,7 @@ class ConnectionParser(LoggerMixin):
                 'object_data': object_data,
                 'metadata': {
                     'description': self._get_attr(conn_elem, 'Description', namespaces),
-                    'retain_same_connection': self._get_attr(conn_elem, 'RetainSameConnection', namespaces).lower() == 'true'
+                    'retain_same_connection': self._get_attr(conn_elem, 'RetainSameConnection', namespaces) in _TRUTHY
                 }
             }
             
@@ -76,9 +142,9 @@ class ConnectionParser(LoggerMixin):
     
     def _get_attr(self, element: ET.Element, attr_name: str, namespaces: Dict[str, str], default: str = '') -> str:
         """Get attribute value with namespace handling"""
-        # Try with namespace first
-        ns_attr = f'{{{namespaces["DTS"]}}}{attr_name}'
-        value = element.get(ns_attr)
+        # Try with namespace first; the qualified key is cached rather
+        # than re-formatted per lookup
+        value = element.get(_clark_name(namespaces['DTS'], attr_name))
         if value is not None:
             return value
         # Try without namespace
@@ -86,18 +152,14 @@ class ConnectionParser(LoggerMixin):
     
     def _get_connection_type(self, creation_name: str) -> str:
         """Get human-readable connection type from creation name"""
-        # Extract the type from creation name (e.g., "OLEDB" from "Microsoft.OLEDB")
-        if '.' in creation_name:
-            type_part = creation_name.split('.')[-1]
-            return self.connection_types.get(type_part, type_part)
-        return creation_name
+        return _conn_type_from_creation(creation_name)
     
     def _parse_connection_properties(self, conn_elem: ET.Element, namespaces: Dict[str, str]) -> Dict[str, Any]:
         """Parse connection manager properties"""
         properties = {}
         
         # Look for properties in various locations
-        for prop_elem in conn_elem.findall('.//DTS:Property', namespaces):
+        for prop_elem in _query(conn_elem, namespaces, './/DTS:Property'):
             prop_name = self._get_attr(prop_elem, 'Name', namespaces)
             prop_value = self._get_attr(prop_elem, 'Value', namespaces)
             if prop_name:
@@ -109,21 +171,19 @@ class ConnectionParser(LoggerMixin):
         """Parse connection manager object data"""
         object_data = {}
         
-        obj_data_elem = conn_elem.find('DTS:ObjectData', namespaces)
-        if obj_data_elem is None:
-            obj_data_elem = conn_elem.find('ObjectData')
+        found = _query(conn_elem, namespaces, 'DTS:ObjectData')
+        obj_data_elem = found[0] if found else conn_elem.find('ObjectData')
         
         if obj_data_elem is not None:
             # Look for nested connection manager elements
-            nested_conn = obj_data_elem.find('DTS:ConnectionManager', namespaces)
-            if nested_conn is None:
-                nested_conn = obj_data_elem.find('ConnectionManager')
+            found = _query(obj_data_elem, namespaces, 'DTS:ConnectionManager')
+            nested_conn = found[0] if found else obj_data_elem.find('ConnectionManager')
             
             if nested_conn is not None:
                 object_data['nested_connection_string'] = self._get_attr(nested_conn, 'ConnectionString', namespaces)
                 
                 # Parse nested properties
-                for prop_elem in nested_conn.findall('DTS:Property', namespaces):
+                for prop_elem in _query(nested_conn, namespaces, 'DTS:Property'):
                     prop_name = self._get_attr(prop_elem, 'Name', namespaces)
                     prop_value = self._get_attr(prop_elem, 'Value', namespaces)
                     if prop_name:
@@ -157,18 +217,15 @@ class ConnectionParser(LoggerMixin):
     
     def is_database_connection(self, conn_type: str) -> bool:
         """Check if connection is a database connection"""
-        db_types = ['OLE DB Connection', 'ADO.NET Connection', 'ODBC Connection']
-        return conn_type in db_types
+        return conn_type in _DB_TYPES
     
     def is_file_connection(self, conn_type: str) -> bool:
         """Check if connection is a file connection"""
-        file_types = ['Flat File Connection', 'Excel Connection', 'File Connection']
-        return conn_type in file_types
+        return conn_type in _FILE_TYPES
     
     def is_web_connection(self, conn_type: str) -> bool:
         """Check if connection is a web service connection"""
-        web_types = ['HTTP Connection', 'FTP Connection', 'SMTP Connection']
-        return conn_type in web_types
+        return conn_type in _WEB_TYPES
     
     def get_connection_summary(self, conn_info: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -3,7 +3,8 @@
 DTSX Parser - Main parser for SSIS .dtsx files
 """
 
-import xml.etree.ElementTree as ET
+from lxml import etree as ET
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
@@ -15,11 +16,11 @@ from ..core.error_handler import (
 from .component_parser import ComponentParser
 from .connection_parser import ConnectionParser
 from .variable_parser import VariableParser
-from .config_parser import ConfigParser, ConfigFile
+from .config_parser import ConfigParser, ConfigFile, _ENV_ALT
 import os
 
 
-@dataclass
+@dataclass(slots=True)
 class SSISPackage:
     """Represents a parsed SSIS package"""
     name: str
@@ -37,7 +38,7 @@ class SSISPackage:
     environment_variables: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsingResult:
     """Result of parsing a DTSX file"""
     success: bool
@@ -48,7 +49,26 @@ class ParsingResult:
 
 class DTSXParser(LoggerMixin):
     """Main parser for SSIS .dtsx files"""
-    
+
+    # Local attribute name to collected key; one pass over root.attrib
+    # replaces a dozen qualified/plain double probes during metadata
+    # extraction
+    _META_FIELDS = {
+        'ObjectName': 'name',
+        'VersionMajor': 'version_major',
+        'VersionMinor': 'version_minor',
+        'VersionBuild': 'version_build',
+        'Description': 'description',
+        'CreationDate': 'creation_date',
+        'CreatorName': 'creator',
+        'DTSID': 'package_id',
+        'ExecutableType': 'executable_type',
+        'CreationName': 'creation_name',
+        'CreatorComputerName': 'creator_computer',
+        'PackageType': 'package_type',
+        'VersionGUID': 'version_guid',
+    }
+
     def __init__(self, error_handler: Optional[ErrorHandler] = None):
         self.logger.info("DTSX Parser initialized")
         self.component_parser = ComponentParser()
@@ -63,6 +83,51 @@ class DTSXParser(LoggerMixin):
             'pipeline': 'www.microsoft.com/sqlserver/dts/pipeline',
             'SQLTask': 'www.microsoft.com/sqlserver/dts/tasks/sqltask'
         }
+
+        # Recurring traversals compiled once at construction; each union
+        # covers the namespaced and non-namespaced spellings in a single
+        # pass instead of a find-then-fallback pair
+        ns = self.namespaces
+        self._xp_conn = ET.XPath(
+            'DTS:ConnectionManager|ConnectionManager',
+            namespaces=ns
+        )
+        self._xp_vars = ET.XPath(
+            'DTS:Variable|Variable',
+            namespaces=ns
+        )
+        self._xp_execs = ET.XPath(
+            'DTS:Executable|Executable',
+            namespaces=ns
+        )
+        self._xp_object_data = ET.XPath(
+            'DTS:ObjectData|ObjectData',
+            namespaces=ns
+        )
+        self._xp_dataflow_components = ET.XPath(
+            'pipeline:dataflow/pipeline:components/pipeline:component',
+            namespaces=ns
+        )
+        self._xp_sql_task_data = ET.XPath(
+            'SQLTask:SqlTaskData|SqlTaskData',
+            namespaces=ns
+        )
+
+        # Namespace-qualified attribute keys, formatted once here rather
+        # than per lookup; the dicts self-fill for any name not listed
+        self._dts_qn = {
+            name: f'{{{ns["DTS"]}}}{name}'
+            for name in (
+                'ObjectName', 'VersionMajor', 'VersionMinor', 'VersionBuild',
+                'Description', 'CreationDate', 'CreatorName', 'DTSID',
+                'ExecutableType', 'CreationName', 'CreatorComputerName',
+                'PackageType', 'VersionGUID'
+            )
+        }
+        self._sql_qn = {
+            name: f'{{{ns["SQLTask"]}}}{name}'
+            for name in ('Connection', 'SqlStatementSource', 'ResultType')
+        }
     
     def parse_file(self, file_path: str) -> ParsingResult:
         """
@@ -113,10 +178,35 @@ class DTSXParser(LoggerMixin):
                 )
                 return ParsingResult(False, errors=[str(error)])
             
-            # Parse XML
+            # Stream-parse the XML: each top-level section is handled as
+            # its end tag arrives and freed immediately, so memory stays
+            # bounded by the largest section instead of the whole file
+            package = None
             try:
-                tree = ET.parse(file_path)
-                root = tree.getroot()
+                root = None
+                for event, elem in ET.iterparse(str(file_path), events=('start', 'end')):
+                    if event == 'start':
+                        if root is None:
+                            root = elem
+                            # Root attributes are complete at its start
+                            # event; metadata needs nothing deeper
+                            package = self._extract_package_metadata(root)
+                        continue
+                    tag = elem.tag
+                    if not isinstance(tag, str) or elem.getparent() is not root:
+                        continue
+                    local = tag.rsplit('}', 1)[-1]
+                    if local == 'ConnectionManagers':
+                        package.connection_managers = self._parse_connection_managers(elem)
+                    elif local == 'Variables':
+                        package.variables = self._parse_variables(elem)
+                    elif local == 'Executables':
+                        self._parse_executables(elem, package)
+                    else:
+                        continue
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del root[0]
             except ET.ParseError as e:
                 error = ParsingError(
                     f"XML parsing error: {str(e)}",
@@ -133,18 +223,6 @@ class DTSXParser(LoggerMixin):
                 )
                 return ParsingResult(False, errors=[str(error)])
             
-            # Extract package metadata
-            package = self._extract_package_metadata(root)
-            
-            # Parse connection managers
-            package.connection_managers = self._parse_connection_managers(root)
-            
-            # Parse variables
-            package.variables = self._parse_variables(root)
-            
-            # Parse executables (tasks and data flows)
-            self._parse_executables(root, package)
-            
             # Parse configuration files
             package.configuration_files = self._parse_configuration_files(file_path)
             
@@ -172,95 +250,63 @@ class DTSXParser(LoggerMixin):
     
     def _extract_package_metadata(self, root: ET.Element) -> SSISPackage:
         """Extract basic package metadata from the root element"""
-        # Handle both namespaced and non-namespaced attributes
-        def get_attr(element, attr_name):
-            # Try with namespace first
-            ns_attr = f'{{{self.namespaces["DTS"]}}}{attr_name}'
-            value = element.get(ns_attr)
-            if value is not None:
-                return value
-            # Try without namespace
-            return element.get(attr_name, '')
-        
+        # One pass over the attributes, stripping any namespace from the
+        # key; namespaced and plain spellings land in the same slot
+        fields = self._META_FIELDS
+        found = {}
+        for key, value in root.attrib.items():
+            target = fields.get(key.rsplit('}', 1)[-1])
+            if target is not None:
+                found[target] = value
+
+        get = found.get
         package = SSISPackage(
-            name=get_attr(root, 'ObjectName'),
-            version=f"{get_attr(root, 'VersionMajor')}.{get_attr(root, 'VersionMinor')}.{get_attr(root, 'VersionBuild')}",
-            description=get_attr(root, 'Description'),
-            creation_date=get_attr(root, 'CreationDate'),
-            creator=get_attr(root, 'CreatorName'),
-            package_id=get_attr(root, 'DTSID'),
+            name=get('name', ''),
+            version=f"{get('version_major', '')}.{get('version_minor', '')}.{get('version_build', '')}",
+            description=get('description', ''),
+            creation_date=get('creation_date', ''),
+            creator=get('creator', ''),
+            package_id=get('package_id', ''),
             metadata={
-                'executable_type': get_attr(root, 'ExecutableType'),
-                'creation_name': get_attr(root, 'CreationName'),
-                'creator_computer': get_attr(root, 'CreatorComputerName'),
-                'package_type': get_attr(root, 'PackageType'),
-                'version_guid': get_attr(root, 'VersionGUID')
+                'executable_type': get('executable_type', ''),
+                'creation_name': get('creation_name', ''),
+                'creator_computer': get('creator_computer', ''),
+                'package_type': get('package_type', ''),
+                'version_guid': get('version_guid', '')
             }
         )
         return package
     
-    def _parse_connection_managers(self, root: ET.Element) -> List[Dict[str, Any]]:
-        """Parse connection managers from the package"""
+    def _parse_connection_managers(self, section_elem: ET.Element) -> List[Dict[str, Any]]:
+        """Parse connection managers from a ConnectionManagers section"""
         connection_managers = []
-        
-        # Find connection managers section - try both namespaced and non-namespaced
-        conn_managers_elem = root.find('DTS:ConnectionManagers', self.namespaces)
-        if conn_managers_elem is None:
-            conn_managers_elem = root.find('ConnectionManagers')
-        
-        if conn_managers_elem is not None:
-            # Look for connection manager elements
-            conn_elems = conn_managers_elem.findall('DTS:ConnectionManager', self.namespaces)
-            if not conn_elems:
-                conn_elems = conn_managers_elem.findall('ConnectionManager')
-            
-            for conn_elem in conn_elems:
-                conn_info = self.connection_parser.parse_connection_manager(conn_elem, self.namespaces)
-                if conn_info:
-                    connection_managers.append(conn_info)
+
+        # One compiled query covers namespaced and plain spellings
+        for conn_elem in self._xp_conn(section_elem):
+            conn_info = self.connection_parser.parse_connection_manager(conn_elem, self.namespaces)
+            if conn_info:
+                connection_managers.append(conn_info)
         
         self.logger.info(f"Found {len(connection_managers)} connection managers")
         return connection_managers
     
-    def _parse_variables(self, root: ET.Element) -> List[Dict[str, Any]]:
-        """Parse variables from the package"""
+    def _parse_variables(self, section_elem: ET.Element) -> List[Dict[str, Any]]:
+        """Parse variables from a Variables section"""
         variables = []
-        
-        # Find variables section - try both namespaced and non-namespaced
-        variables_elem = root.find('DTS:Variables', self.namespaces)
-        if variables_elem is None:
-            variables_elem = root.find('Variables')
-        
-        if variables_elem is not None:
-            # Look for variable elements
-            var_elems = variables_elem.findall('DTS:Variable', self.namespaces)
-            if not var_elems:
-                var_elems = variables_elem.findall('Variable')
-            
-            for var_elem in var_elems:
-                var_info = self.variable_parser.parse_variable(var_elem, self.namespaces)
-                if var_info:
-                    variables.append(var_info)
+
+        # One compiled query covers namespaced and plain spellings
+        for var_elem in self._xp_vars(section_elem):
+            var_info = self.variable_parser.parse_variable(var_elem, self.namespaces)
+            if var_info:
+                variables.append(var_info)
         
         self.logger.info(f"Found {len(variables)} variables")
         return variables
     
-    def _parse_executables(self, root: ET.Element, package: SSISPackage) -> None:
-        """Parse executables (tasks and data flows) from the package"""
-        # Find executables section - try both namespaced and non-namespaced
-        executables_elem = root.find('DTS:Executables', self.namespaces)
-        if executables_elem is None:
-            executables_elem = root.find('Executables')
-        
-        if executables_elem is None:
-            return
-        
-        # Look for executable elements
-        exec_elems = executables_elem.findall('DTS:Executable', self.namespaces)
-        if not exec_elems:
-            exec_elems = executables_elem.findall('Executable')
-        
-        for exec_elem in exec_elems:
+    def _parse_executables(self, section_elem: ET.Element, package: SSISPackage) -> None:
+        """Parse executables (tasks and data flows) from an Executables section"""
+        # One compiled query covers namespaced and plain spellings
+        for exec_elem in self._xp_execs(section_elem):
             exec_type = self._get_attr(exec_elem, 'ExecutableType')
             
             if exec_type == 'Microsoft.DataFlowTask':
@@ -278,30 +324,14 @@ class DTSXParser(LoggerMixin):
     
     def _parse_data_flow_task(self, task_elem: ET.Element) -> List[Dict[str, Any]]:
         """Parse data flow task and extract components"""
-        components = []
-        
         # Find the data flow pipeline
-        object_data = task_elem.find('DTS:ObjectData', self.namespaces)
-        if object_data is None:
-            object_data = task_elem.find('ObjectData')
-        
-        if object_data is None:
-            return components
-        
-        # Look for pipeline:dataflow element
-        dataflow_elem = object_data.find('pipeline:dataflow', self.namespaces)
-        if dataflow_elem is None:
-            return components
-        
-        # Parse components
-        components_elem = dataflow_elem.find('pipeline:components', self.namespaces)
-        if components_elem is not None:
-            for comp_elem in components_elem.findall('pipeline:component', self.namespaces):
-                comp_info = self.component_parser.parse_data_flow_component(comp_elem, self.namespaces)
-                if comp_info:
-                    components.append(comp_info)
-        
-        return components
+        found = self._xp_object_data(task_elem)
+        if not found:
+            return []
+
+        # One compiled query walks dataflow/components/component
+        comp_elems = self._xp_dataflow_components(found[0])
+        return self.component_parser.parse_components(comp_elems, self.namespaces)
     
     def _parse_control_flow_task(self, task_elem: ET.Element) -> Optional[Dict[str, Any]]:
         """Parse control flow task"""
@@ -315,42 +345,43 @@ class DTSXParser(LoggerMixin):
         }
         
         # Parse task-specific properties
-        object_data = task_elem.find('DTS:ObjectData', self.namespaces)
-        if object_data is None:
-            object_data = task_elem.find('ObjectData')
-        
-        if object_data is not None:
+        found = self._xp_object_data(task_elem)
+
+        if found:
             # Handle different task types
             if task_info['creation_name'] == 'Microsoft.ExecuteSQLTask':
-                sql_task_data = object_data.find('SQLTask:SqlTaskData', self.namespaces)
-                if sql_task_data is not None:
-                    # Get SQL task properties with proper namespace handling
-                    def get_sql_attr(element, attr_name):
-                        # Try with namespace first
-                        ns_attr = f'{{{self.namespaces["SQLTask"]}}}{attr_name}'
-                        value = element.get(ns_attr)
-                        if value is not None:
-                            return value
-                        # Try without namespace
-                        return element.get(attr_name, '')
-                    
+                sql_found = self._xp_sql_task_data(found[0])
+                if sql_found:
+                    sql_task_data = sql_found[0]
                     task_info['properties'] = {
-                        'connection': get_sql_attr(sql_task_data, 'Connection'),
-                        'sql_statement': get_sql_attr(sql_task_data, 'SqlStatementSource'),
-                        'result_type': get_sql_attr(sql_task_data, 'ResultType')
+                        'connection': self._get_sql_attr(sql_task_data, 'Connection'),
+                        'sql_statement': self._get_sql_attr(sql_task_data, 'SqlStatementSource'),
+                        'result_type': self._get_sql_attr(sql_task_data, 'ResultType')
                     }
         
         return task_info
     
     def _get_attr(self, element: ET.Element, attr_name: str) -> str:
         """Get attribute value with namespace handling"""
-        # Try with namespace first
-        ns_attr = f'{{{self.namespaces["DTS"]}}}{attr_name}'
-        value = element.get(ns_attr)
+        # Try with namespace first; the qualified key is cached
+        qn = self._dts_qn.get(attr_name)
+        if qn is None:
+            qn = self._dts_qn[attr_name] = f'{{{self.namespaces["DTS"]}}}{attr_name}'
+        value = element.get(qn)
         if value is not None:
             return value
         # Try without namespace
         return element.get(attr_name, '')
+
+    def _get_sql_attr(self, element: ET.Element, attr_name: str) -> str:
+        """Get SQLTask attribute value with namespace handling"""
+        qn = self._sql_qn.get(attr_name)
+        if qn is None:
+            qn = self._sql_qn[attr_name] = f'{{{self.namespaces["SQLTask"]}}}{attr_name}'
+        value = element.get(qn)
+        if value is not None:
+            return value
+        return element.get(attr_name, '')
     
     def validate_dtsx_structure(self, file_path: str) -> bool:
         """
@@ -379,11 +410,11 @@ class DTSXParser(LoggerMixin):
         """Parse associated configuration files"""
         config_files = []
         found_paths = set()
-        
+
         # Look for .dtsConfig files in the same directory
         config_dir = dtsx_file_path.parent
         package_name = dtsx_file_path.stem
-        
+
         # Common configuration file patterns
         config_patterns = [
             f"{package_name}.dtsConfig",
@@ -391,25 +422,40 @@ class DTSXParser(LoggerMixin):
             "package.dtsConfig",
             "package.dtsconfig"
         ]
-        
+
+        # One scandir serves both the explicit patterns and the
+        # *.dtsConfig sweep, replacing a stat per pattern plus a full
+        # glob traversal of the same directory
+        try:
+            entries = {e.name: e.path for e in os.scandir(config_dir) if e.is_file()}
+        except OSError:
+            return config_files
+
+        paths = []
         for pattern in config_patterns:
-            config_file_path = config_dir / pattern
-            if config_file_path.exists() and str(config_file_path.absolute()) not in found_paths:
-                self.logger.info(f"Found configuration file: {config_file_path}")
-                config_file = self.config_parser.parse_config_file(str(config_file_path))
-                if config_file:
-                    config_files.append(config_file)
-                    found_paths.add(str(config_file_path.absolute()))
-        
-        # Also look for any .dtsConfig files in the directory
-        for config_file_path in config_dir.glob("*.dtsConfig"):
-            if str(config_file_path.absolute()) not in found_paths:
-                self.logger.info(f"Found additional configuration file: {config_file_path}")
-                config_file = self.config_parser.parse_config_file(str(config_file_path))
-                if config_file:
-                    config_files.append(config_file)
-                    found_paths.add(str(config_file_path.absolute()))
-        
+            entry_path = entries.get(pattern)
+            if entry_path and entry_path not in found_paths:
+                self.logger.info(f"Found configuration file: {entry_path}")
+                paths.append(entry_path)
+                found_paths.add(entry_path)
+
+        # Also pick up any other .dtsConfig files seen in the scan
+        for name, entry_path in entries.items():
+            if name.lower().endswith('.dtsconfig') and entry_path not in found_paths:
+                self.logger.info(f"Found additional configuration file: {entry_path}")
+                paths.append(entry_path)
+                found_paths.add(entry_path)
+
+        # Config files are independent I/O plus C-level XML parsing, so
+        # multiple files parse concurrently; a single file skips the
+        # pool setup cost
+        if len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+                parsed = list(pool.map(self.config_parser.parse_config_file, paths))
+        else:
+            parsed = [self.config_parser.parse_config_file(p) for p in paths]
+        config_files = [config_file for config_file in parsed if config_file]
+
         self.logger.info(f"Found {len(config_files)} configuration files")
         return config_files
     
@@ -421,25 +467,23 @@ class DTSXParser(LoggerMixin):
         for config_file in package.configuration_files:
             env_vars.update(config_file.environment_variables)
         
-        # Extract from connection strings
-        for conn in package.connection_managers:
-            conn_string = conn.get('connection_string', '')
-            env_vars_in_conn = self.config_parser._find_environment_variables(conn_string)
-            for env_var in env_vars_in_conn:
-                env_vars[env_var] = os.environ.get(env_var, '')
-        
-        # Extract from variables
-        for var in package.variables:
-            var_value = var.get('value', '')
-            env_vars_in_var = self.config_parser._find_environment_variables(var_value)
-            for env_var in env_vars_in_var:
-                env_vars[env_var] = os.environ.get(env_var, '')
-        
-        # Extract from control flow tasks
+        # Gather every remaining candidate string (connection strings,
+        # variable values, control flow task properties) and scan them in
+        # one pass: joined on NUL, which cannot occur inside a reference,
+        # the compiled alternation runs once instead of once per string
+        blobs = [conn.get('connection_string', '') for conn in package.connection_managers]
+        blobs.extend(var.get('value', '') for var in package.variables)
         for task in package.control_flow_tasks:
-            task_props = task.get('properties', {})
-            for prop_value in task_props.values():
-                if isinstance(prop_value, str):
-                    env_vars_in_prop = self.config_parser._find_environment_variables(prop_value)
-                    for env_var in env_vars_in_prop:
-                        env_vars[env_var] = os.environ.get(env_var, '') 
\ No newline at end of file
+            blobs.extend(
+                prop_value for prop_value in task.get('properties', {}).values()
+                if isinstance(prop_value, str)
+            )
+
+        names = {
+            dollar or percent or user
+            for dollar, percent, user in _ENV_ALT.findall('\x00'.join(blobs))
+        }
+        for name in names:
+            env_vars[name] = os.environ.get(name, '')
+
+        return env_vars 
\ No newline at end of file
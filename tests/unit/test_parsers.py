@@ -7,7 +7,9 @@ import pytest
 import tempfile
 import os
 from pathlib import Path
+from lxml import etree
 from ssis_migrator.core.converter import SSISConverter
+from ssis_migrator.parsers.component_parser import ComponentParser
 from ssis_migrator.validators.code_validator import CodeValidator
 from ssis_migrator.validators.test_runner import TestRunner
 from ssis_migrator.validators.performance_benchmarker import PerformanceBenchmarker
@@ -145,8 +147,70 @@ class TestParsers:
     def test_performance_benchmarker_benchmark_nonexistent_package(self):
         """Test benchmarking nonexistent package"""
         benchmarker = PerformanceBenchmarker()
-        
+
         result = benchmarker.benchmark_package("nonexistent_directory")
         assert result.execution_time == 0.0
         assert result.memory_usage == 0.0
-        assert result.throughput == 0.0 
\ No newline at end of file
+        assert result.throughput == 0.0
+
+
+class _BrokenElement:
+    """Stand-in element whose parse blows up past the initial attribute reads"""
+
+    tag = 'component'
+
+    def get(self, name, default=''):
+        return default
+    # No findall/xpath: property parsing raises AttributeError
+
+
+class TestComponentParser:
+    """Test batch component parsing"""
+
+    PIPELINE_NS = 'www.microsoft.com/sqlserver/dts/pipeline'
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.parser = ComponentParser()
+        self.namespaces = {'pipeline': self.PIPELINE_NS}
+
+    def _make_component(self, class_id, name):
+        return etree.fromstring(
+            f'<component xmlns:pipeline="{self.PIPELINE_NS}" '
+            f'pipeline:componentClassID="{class_id}" pipeline:name="{name}"/>'
+        )
+
+    def test_parse_components_success(self):
+        """Test parsing a batch of valid components"""
+        elems = [
+            self._make_component('{E9216C7C-4A8A-4F77-8948-60C5D8C75F70}', 'Source'),
+            self._make_component('{E9216C7C-4A8A-4F77-8948-60C5D8C75F71}', 'Destination'),
+        ]
+
+        result = self.parser.parse_components(elems, self.namespaces)
+
+        assert [c['name'] for c in result] == ['Source', 'Destination']
+        assert [c['type'] for c in result] == ['OLE DB Source', 'OLE DB Destination']
+
+    def test_parse_components_skips_failing_component(self):
+        """Test that one failing component does not drop the batch"""
+        elems = [
+            self._make_component('{E9216C7C-4A8A-4F77-8948-60C5D8C75F70}', 'Source'),
+            _BrokenElement(),
+            self._make_component('{E9216C7C-4A8A-4F77-8948-60C5D8C75F71}', 'Destination'),
+        ]
+
+        result = self.parser.parse_components(elems, self.namespaces)
+
+        assert [c['name'] for c in result] == ['Source', 'Destination']
+
+    def test_parse_components_filters_non_elements(self):
+        """Test that comments and other non-element nodes are skipped"""
+        elems = [
+            etree.Comment('not a component'),
+            self._make_component('{E9216C7C-4A8A-4F77-8948-60C5D8C75F70}', 'Source'),
+        ]
+
+        result = self.parser.parse_components(elems, self.namespaces)
+
+        assert [c['name'] for c in result] == ['Source'] 
\ No newline at end of file
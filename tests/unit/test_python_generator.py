@@ -246,14 +246,93 @@ class TestPythonScriptGenerator(unittest.TestCase):
         self.assertIn("def execute_control_flow", functions)
         self.assertIn("TestTask", functions)
     
-    def test_generate_main_execution_steps(self):
-        """Test main execution steps generation"""
-        steps = self.generator._generate_main_execution_steps(self.sample_package)
-        
-        self.assertIsInstance(steps, str)
-        self.assertIn("process_data_flow", steps)
-        self.assertIn("execute_control_flow", steps)
-    
+    def test_generate_scripts_streaming_matches_in_memory_output(self):
+        """Test that streamed scripts match what generate_scripts produces"""
+        fixed_now = datetime(2024, 1, 1, 12, 0, 0)
+        with tempfile.TemporaryDirectory() as stream_dir, \
+                tempfile.TemporaryDirectory() as batch_dir, \
+                patch('src.ssis_migrator.generators.python_generator.datetime') as mock_dt:
+            mock_dt.now.return_value = fixed_now
+
+            in_memory = self.generator.generate_scripts(self.sample_package, batch_dir)
+            streamed = self.generator.generate_scripts_streaming(self.sample_package, stream_dir)
+
+            self.assertTrue(in_memory.success)
+            self.assertTrue(streamed.success)
+            self.assertEqual(
+                [s.name for s in in_memory.scripts],
+                [s.name for s in streamed.scripts]
+            )
+
+            # Manifests carry no content; the rendered text lives on disk
+            # and must be byte-for-byte what the in-memory path produced
+            for expected, manifest in zip(in_memory.scripts, streamed.scripts):
+                self.assertEqual(manifest.content, "")
+                on_disk = (Path(stream_dir) / manifest.name).read_text(encoding='utf-8')
+                self.assertEqual(on_disk, expected.content)
+
+    def test_generate_scripts_cache_hit_on_second_run(self):
+        """Test that regenerating an unchanged package hits the script cache"""
+        with tempfile.TemporaryDirectory() as output_dir:
+            fingerprint_before = self.generator._package_fingerprint(self.sample_package)
+            first = self.generator.generate_scripts(self.sample_package, output_dir)
+            self.assertTrue(first.success)
+
+            # Generation must not mutate the package, otherwise the
+            # fingerprint drifts and the cache never hits
+            self.assertEqual(
+                fingerprint_before,
+                self.generator._package_fingerprint(self.sample_package)
+            )
+
+            # On a warm cache the second run loads the pickle instead of
+            # regenerating, so _write_script_cache is never reached
+            with patch.object(self.generator, '_write_script_cache') as mock_write:
+                second = self.generator.generate_scripts(self.sample_package, output_dir)
+
+            self.assertTrue(second.success)
+            mock_write.assert_not_called()
+            self.assertEqual(
+                [(s.name, s.content) for s in first.scripts],
+                [(s.name, s.content) for s in second.scripts]
+            )
+
+    def test_package_fingerprint_covers_all_rendered_fields(self):
+        """Test that changing any rendered field changes the fingerprint"""
+        import copy
+
+        baseline = self.generator._package_fingerprint(self.sample_package)
+        changes = {
+            'description': 'A different description',
+            'creation_date': '2025-06-15',
+            'creator': 'OtherUser',
+            'environment_variables': {'DB_HOST': 'otherhost'},
+        }
+        for field_name, new_value in changes.items():
+            variant = copy.deepcopy(self.sample_package)
+            setattr(variant, field_name, new_value)
+            self.assertNotEqual(
+                baseline,
+                self.generator._package_fingerprint(variant),
+                f"fingerprint ignores {field_name}"
+            )
+
+    def test_generate_scripts_does_not_serve_another_packages_cache(self):
+        """Test that packages differing only in description get fresh scripts"""
+        import copy
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            first = self.generator.generate_scripts(self.sample_package, output_dir)
+            self.assertTrue(first.success)
+
+            variant = copy.deepcopy(self.sample_package)
+            variant.description = "Changed description"
+            second = self.generator.generate_scripts(variant, output_dir)
+
+            self.assertTrue(second.success)
+            main_script = next(s for s in second.scripts if s.name.endswith('_main.py'))
+            self.assertIn("Changed description", main_script.content)
+
     def test_error_handling_in_generation(self):
         """Test error handling during generation"""
         # Create a package with invalid data to trigger errors